@@ -3,7 +3,7 @@
 """macOS-specific draft monitor that appends picks to an OPEN Numbers document without switching sheets."""
 import os
 import sys
-import time
+import asyncio
 import logging
 import subprocess
 from dotenv import load_dotenv
@@ -11,13 +11,18 @@ from dotenv import load_dotenv
 # Add parent directory to path to import yahoo_api
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from yahoo_api import YahooFantasyAPI
+from macos.numbers_helpers import run_applescript
 
 load_dotenv()
 
 logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
 LOG = logging.getLogger("draft_monitor")
 
-INTERVAL = 10  # Check for new picks every 10 seconds
+# Poll interval (seconds): MIN_INTERVAL while picks are flowing, growing by BACKOFF per
+# quiet poll up to MAX_INTERVAL (e.g. before the draft starts)
+MIN_INTERVAL = 3
+MAX_INTERVAL = 60
+BACKOFF = 1.5
 
 filename = os.getenv('FILENAME', 'fantasy_draft_data.numbers')
 if not filename.lower().endswith('.numbers'):
@@ -28,7 +33,10 @@ if not filename.lower().endswith('.numbers'):
 
 numbers_abs = os.path.abspath(filename)
 api = YahooFantasyAPI()
-seen_picks: set[int] = set()
+
+# Highest pick number handled so far. Yahoo numbers picks 1..N in draft order, so one int
+# watermark replaces a set of every seen pick.
+max_seen = 0
 
 
 def _scalar(v):
@@ -37,137 +45,187 @@ def _scalar(v):
     return v
 
 
-def _player_key(dr):
-    return dr.get('player_key', '')
-
-
 def collect_new(draft_results):
-    """Collect new draft picks that haven't been seen yet."""
-    rows = []
-    for dr in draft_results:
-        try:
-            pick_raw = _scalar(dr.get('pick'))
-            if pick_raw is None:
-                continue
-            pick_num = int(pick_raw)
-            if pick_num in seen_picks:
-                continue
-            rnd = _scalar(dr.get('round')) or ''
-            team_key = _scalar(dr.get('team_key')) or ''
-            player_key = _player_key(dr) or ''
-            rows.append([rnd, pick_num, player_key, team_key, ""])
-            seen_picks.add(pick_num)
-        except Exception:
+    """Collect new draft picks that haven't been seen yet.
+
+    Yahoo lists draft results in pick order, so the walk runs from the end and stops at the
+    first pick at or below the watermark: each poll touches only the new picks, and they
+    come out already ordered (no sort). Idle polls return a shared empty tuple without
+    allocating anything.
+    """
+    global max_seen
+    if not draft_results:  # idle poll (get_draft_results already trimmed to new picks)
+        return ()
+    watermark = max_seen  # local name instead of a global lookup per result
+    fresh = {}
+    for dr in reversed(draft_results):
+        pick_raw = dr.get('pick')
+        if type(pick_raw) is dict:  # xmltodict node with attributes
+            pick_raw = _scalar(pick_raw)
+        # Validate up front instead of catching int() failures inside the loop
+        if type(pick_raw) is str and pick_raw.isdecimal():
+            pick = int(pick_raw)
+        elif type(pick_raw) is int:
+            pick = pick_raw
+        else:
             continue
-    rows.sort(key=lambda r: r[1])
+        if pick <= watermark:
+            break
+        # Walking backwards, a later assignment is an earlier occurrence: first occurrence wins
+        # Immutable 5-tuple (round, pick, player_key, team_key, manager): smaller than a list
+        fresh[pick] = (_scalar(dr.get('round')) or '', pick, dr.get('player_key') or '', _scalar(dr.get('team_key')) or '', "")
+    rows = list(fresh.values())
+    rows.reverse()
+    if fresh:
+        max_seen = max(fresh)
     return rows
 
 
-def _rows_to_applescript(rows):
-    """Convert Python rows to AppleScript list format."""
-    applescript_rows = []
-    for row in rows:
-        row_items = []
-        for cell in row:
-            if cell is None:
-                row_items.append('""')
-            elif isinstance(cell, (int, float)):
-                row_items.append(str(cell))
-            else:
-                escaped = str(cell).replace('"', '\\"')
-                row_items.append(f'"{escaped}"')
-        applescript_rows.append('{' + ', '.join(row_items) + '}')
-    return '{' + ', '.join(applescript_rows) + '}'
-
-
-# ...existing code...
-def append_picks_silently(rows):
-    """
-    Append draft picks to Draft Results WITHOUT leaving user on that sheet.
-    Restores previously active sheet after insertion.
-    """
-    if not rows:
-        return True
+# Separator characters inside a cell are blanked in one C-level pass
+_SEP_TBL = str.maketrans('\x1e\x1f', '  ')
 
-    rows_script = _rows_to_applescript(rows)
 
-    script = f'''
-on run
-    set newRows to {rows_script}
+def _cell_text(cell):
+    if cell is None:
+        return ''
+    if isinstance(cell, int):
+        return str(cell)  # picks / rounds: no separators possible
+    return str(cell).translate(_SEP_TBL)
 
-    tell application "Numbers"
-        if (count of documents) is 0 then
-            return "ERROR: No Numbers document is open"
-        end if
 
-        tell document 1
-            -- Remember which sheet the user had active
-            set priorSheetName to name of active sheet
+def _rows_to_payload(rows):
+    """Pack rows into one argv string (rows / cells joined by ASCII RS / US)."""
+    return '\x1e'.join('\x1f'.join(map(_cell_text, row)) for row in rows)
 
-            set sheetExists to false
-            repeat with s in sheets
-                if name of s is "Draft Results" then
-                    set sheetExists to true
-                    exit repeat
-                end if
-            end repeat
-            if not sheetExists then
-                return "ERROR: Draft Results sheet not found"
+
+# Constant source: the picks arrive as an argument, so in-process the script is compiled once
+# per monitor run (run_applescript caches it) instead of being re-parsed every poll.
+APPEND_SCRIPT = '''
+on run argv
+    return append_rows(item 1 of argv)
+end run
+
+on append_rows(payload)
+    set newRows to my split_text(payload, 30)
+
+    -- Bounds each Apple Event, so a blocked Numbers (modal dialog) errors out quickly;
+    -- run_applescript's timeout bounds the run as a whole
+    with timeout of 10 seconds
+        tell application "Numbers"
+            if (count of documents) is 0 then
+                return "ERROR: No Numbers document is open"
             end if
 
-            -- Write into Draft Results
-            tell sheet "Draft Results"
-                tell table 1
-                    set startRow to 2
-                    set currentRows to row count
-                    repeat with i from 2 to currentRows
-                        set cellVal to value of cell 1 of row i
-                        if cellVal is missing value or cellVal is "" then
-                            set startRow to i
-                            exit repeat
-                        end if
-                    end repeat
-                    if startRow > currentRows then
+            tell document 1
+                -- Remember which sheet the user had active
+                set priorSheetName to name of active sheet
+
+                -- One Apple Event fetches every sheet name
+                if (name of sheets) does not contain "Draft Results" then
+                    return "ERROR: Draft Results sheet not found"
+                end if
+
+                -- Write into Draft Results
+                tell sheet "Draft Results"
+                    tell table 1
+                        -- Columns A and B in one Apple Event each, then find the first empty row locally
+                        set colVals to value of cells of column 1
+                        set pickVals to value of cells of column 2
+                        set currentRows to count of colVals
                         set startRow to currentRows + 1
-                    end if
+                        repeat with i from 2 to currentRows
+                            set cellVal to item i of colVals
+                            if cellVal is missing value or cellVal is "" then
+                                set startRow to i
+                                exit repeat
+                            end if
+                        end repeat
 
-                    set neededRows to startRow + (count of newRows) - 1
-                    if neededRows > currentRows then
-                        repeat (neededRows - currentRows) times
-                            add row below last row
+                        -- Skip picks already in column B: re-sending the rows of an append that
+                        -- was reported as failed but still landed must not write them twice
+                        set seenPicks to {}
+                        repeat with i from 2 to (startRow - 1)
+                            try
+                                set end of seenPicks to (item i of pickVals) as integer
+                            end try
                         end repeat
-                    end if
-
-                    set rowIndex to startRow
-                    repeat with rowData in newRows
-                        set colIndex to 1
-                        repeat with cellValue in rowData
-                            if colIndex ≤ 4 then
-                                set value of cell colIndex of row rowIndex to cellValue
+                        set pendingRows to {}
+                        repeat with rowText in newRows
+                            set rowData to my split_text(contents of rowText, 31)
+                            set pickNum to missing value
+                            try
+                                set pickNum to (item 2 of rowData) as integer
+                            end try
+                            if pickNum is missing value or seenPicks does not contain pickNum then
+                                set end of pendingRows to rowData
                             end if
-                            set colIndex to colIndex + 1
                         end repeat
 
-                        -- Column 5: manager lookup formula
-                        set formulaStr to "=IF(ISERROR(INDEX('Teams'::D;MATCH(D" & rowIndex & ";'Teams'::A;0)));\\"\\";INDEX('Teams'::D;MATCH(D" & rowIndex & ";'Teams'::A;0)))"
-                        set value of cell 5 of row rowIndex to formulaStr
+                        set neededRows to startRow + (count of pendingRows) - 1
+                        if neededRows > currentRows then
+                            set row count to neededRows
+                        end if
 
-                        set rowIndex to rowIndex + 1
-                    end repeat
+                        set rowIndex to startRow
+                        repeat with rowRef in pendingRows
+                            set rowData to contents of rowRef
+                            set colIndex to 1
+                            repeat with cellValue in rowData
+                                if colIndex ≤ 4 then
+                                    set v to contents of cellValue
+                                    if colIndex ≤ 2 then
+                                        -- round / pick are numeric
+                                        try
+                                            set v to v as integer
+                                        end try
+                                    end if
+                                    set value of cell colIndex of row rowIndex to v
+                                end if
+                                set colIndex to colIndex + 1
+                            end repeat
+
+                            -- Column 5: manager lookup formula
+                            set formulaStr to "=IF(ISERROR(INDEX('Teams'::D;MATCH(D" & rowIndex & ";'Teams'::A;0)));\\"\\";INDEX('Teams'::D;MATCH(D" & rowIndex & ";'Teams'::A;0)))"
+                            set value of cell 5 of row rowIndex to formulaStr
+
+                            set rowIndex to rowIndex + 1
+                        end repeat
+                    end tell
                 end tell
-            end tell
 
-            -- Restore previously active sheet (only if different)
-            if priorSheetName is not "Draft Results" then
-                set active sheet to sheet priorSheetName
-            end if
+                -- Restore previously active sheet (only if different)
+                if priorSheetName is not "Draft Results" then
+                    set active sheet to sheet priorSheetName
+                end if
+            end tell
         end tell
-    end tell
+    end timeout
     return "OK"
-end run
+end append_rows
+
+on split_text(t, sepId)
+    set {otid, AppleScript's text item delimiters} to {AppleScript's text item delimiters, character id sepId}
+    set parts to text items of t
+    set AppleScript's text item delimiters to otid
+    return parts
+end split_text
 '''
+
+# Seconds the monitor waits for one append; run_applescript bounds the call itself at 10
+APPEND_TIMEOUT = 15
+
+
+def append_picks_silently(rows):
+    """
+    Append draft picks to Draft Results WITHOUT leaving user on that sheet.
+    Restores previously active sheet after insertion.
+    """
+    if not rows:
+        return True
+
     try:
-        res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=10)
+        # In-process this calls append_rows on the once-compiled script; otherwise osascript
+        res = run_applescript(APPEND_SCRIPT, timeout=10, args=[_rows_to_payload(rows)], handler="append_rows")
         if res.returncode == 0:
             output = res.stdout.strip()
             if output.startswith("ERROR"):
@@ -179,66 +237,37 @@ end run
             LOG.error(f"Failed to append picks: {res.stderr}")
             return False
     except subprocess.TimeoutExpired:
-        LOG.error("Timeout appending picks")
+        LOG.error("Timeout appending picks (is Numbers showing a dialog?)")
         return False
     except Exception as e:
         LOG.error(f"Error appending picks: {e}")
         return False
-# ...existing code...
 
 
 def _set_manager_formulas():
-    """Set formulas for manager column in Draft Results sheet."""
-    # First get row count
-    get_rows_script = '''
-tell application "Numbers"
-    tell document 1
-        tell sheet "Draft Results"
-            tell table 1
-                return row count
-            end tell
-        end tell
-    end tell
-end tell
-'''
-    try:
-        res = subprocess.run(["osascript", "-e", get_rows_script], capture_output=True, text=True, timeout=5)
-        if res.returncode != 0:
-            LOG.error(f"Failed to get row count: {res.stderr}")
-            return
-        row_count = int(res.stdout.strip())
-    except Exception as e:
-        LOG.error(f"Failed to get row count: {e}")
-        return
-
-    # Build formula commands like we do in numbers_export
-    formula_commands = []
-    for r in range(2, row_count + 1):
-        # Column E (manager): INDEX/MATCH lookup from Teams sheet
-        formula_e = (
-            f"IF(ISERROR(INDEX('Teams'::D;MATCH(D{r};'Teams'::A;0)));\\\"\\\";"
-            f"INDEX('Teams'::D;MATCH(D{r};'Teams'::A;0)))"
-        )
-        formula_commands.append(f'tell cell 5 of row {r}')
-        formula_commands.append(f'    set formulaStr to "=" & "{formula_e}"')
-        formula_commands.append(f'    set its value to formulaStr')
-        formula_commands.append(f'end tell')
-
-    formulas_script = '\n                    '.join(formula_commands)
+    """Set formulas for manager column in Draft Results sheet.
 
-    script = f'''
+    One osascript run: the row count is read inside the script instead of by a separate
+    query, and each formula is a concatenation around the row number.
+    """
+    script = '''
 tell application "Numbers"
     tell document 1
         tell sheet "Draft Results"
             tell table 1
-                {formulas_script}
+                repeat with r from 2 to row count
+                    set rs to r as text
+                    -- Column E (manager): INDEX/MATCH lookup from Teams sheet
+                    set value of cell 5 of row r to "=IF(ISERROR(INDEX('Teams'::D;MATCH(D" & rs & ";'Teams'::A;0)));\\"\\";INDEX('Teams'::D;MATCH(D" & rs & ";'Teams'::A;0)))"
+                end repeat
             end tell
         end tell
     end tell
 end tell
+return "OK"
 '''
     try:
-        res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=10)
+        res = run_applescript(script, timeout=10)
         if res.returncode != 0:
             LOG.error(f"Failed to set manager formulas: {res.stderr}")
         else:
@@ -247,10 +276,122 @@ end tell
         LOG.error(f"Failed to set manager formulas: {e}")
 
 
+_polls = 0
+# Background append started by the previous poll, if any.
+_pending_append = None
+# Picks already past the max_seen watermark that still have to reach the sheet: a failed
+# append puts its rows back here and the next poll re-sends them (APPEND_SCRIPT skips any
+# that did land, so a timeout that still wrote them can't duplicate rows).
+_retry_rows = []
+
+
+def _player_names(rows):
+    """Map the player keys in ``rows`` to names (one API request); {} if the lookup fails."""
+    try:
+        return api.get_player_names([r[2] for r in rows])
+    except Exception as e:
+        LOG.debug(f"Player name lookup failed: {e}")
+        return {}
+
+
+async def _append_and_report(new_rows):
+    """Append ``new_rows`` to the sheet and print them once the write has finished."""
+    try:
+        # Player names for the console come from one batched lookup, fetched while Numbers appends
+        # (no wait_for here: run_applescript bounds the append, and an abandoned thread could
+        # still be writing when the retry starts)
+        success, names = await asyncio.gather(
+            asyncio.to_thread(append_picks_silently, new_rows),
+            asyncio.to_thread(_player_names, new_rows),
+        )
+    except Exception as e:
+        LOG.error(f"Append failed: {e}")
+        success = False
+    if success:
+        # One write for the whole burst rather than one print per pick
+        print("\n".join(f"✅ Pick {r[1]}: {names.get(r[2]) or r[2]} (Team: {r[3]})" for r in new_rows))
+    else:
+        print(f"⚠️  Error saving {len(new_rows)} draft picks (will retry on the next check)")
+        # Ahead of anything held back while this append was running
+        _retry_rows[:0] = new_rows
+
+
+async def _poll_once():
+    """Fetch draft results off the event loop and append any new picks; returns the count."""
+    global _polls
+    # Log each polling cycle so user can see continuous activity in log output
+    LOG.info(f"Polling Yahoo API (check #{_polls + 1})...")
+    # Only picks after the highest one already handled
+    results = await asyncio.to_thread(api.get_draft_results, max_seen) or []
+    _polls += 1
+    polls = _polls
+    LOG.info(f"Poll #{polls} complete: total picks returned={len(results)}")
+
+    # Log draft status on first poll
+    if polls == 1:
+        if results:
+            print(f"📋 Found {len(results)} total draft picks so far")
+        else:
+            print("📋 No draft picks found yet")
+
+    new_rows = collect_new(results)
+
+    if new_rows:
+        LOG.info(f"Poll #{polls}: {len(new_rows)} new picks detected")
+    else:
+        LOG.info(f"Poll #{polls}: no new picks")
+        # Show periodic status so user knows it's working
+        if polls % 6 == 1:
+            print(f"⏳ Still monitoring... ({polls} checks completed)")
+
+    global _pending_append
+    if _pending_append is not None and not _pending_append.done():
+        # Appends must land in pick order, so wait out the previous one (usually long done),
+        # but never longer than it is allowed to take
+        try:
+            await asyncio.wait_for(asyncio.shield(_pending_append), APPEND_TIMEOUT)
+        except asyncio.TimeoutError:
+            if new_rows:
+                LOG.warning(f"Previous append still running; holding {len(new_rows)} picks for the next poll")
+                _retry_rows.extend(new_rows)
+            return len(new_rows)
+
+    # Picks from a failed append (or held back above) go first, ahead of this poll's
+    rows = _retry_rows + list(new_rows)
+    _retry_rows.clear()
+    if rows:
+        # Runs in the background so the next fetch overlaps the Numbers write
+        _pending_append = asyncio.create_task(_append_and_report(rows))
+    return len(new_rows)
+
+
+async def _monitor():
+    """Poll on an adaptive interval.
+
+    New picks snap the interval back to MIN_INTERVAL; each quiet poll stretches it by
+    BACKOFF up to MAX_INTERVAL, so an idle monitor makes a fraction of the requests.
+    """
+    loop = asyncio.get_running_loop()
+    interval = MIN_INTERVAL
+    while True:
+        start = loop.time()  # monotonic clock
+        new_picks = 0
+        try:
+            new_picks = await _poll_once()
+        except Exception as e:
+            print(f"⚠️  Error during check #{_polls}: {e}")
+            # Continue monitoring even if one check fails
+        interval = MIN_INTERVAL if new_picks else min(interval * BACKOFF, MAX_INTERVAL)
+
+        remaining = interval - (loop.time() - start)
+        if remaining > 0:
+            await asyncio.sleep(remaining)
+
+
 def main():
     print(f"🏒 Yahoo Fantasy Draft Monitor (macOS)")
     print(f"📊 Monitoring: {filename}")
-    print(f"⏱️  Checking every {INTERVAL} seconds")
+    print(f"⏱️  Checking every {MIN_INTERVAL}-{MAX_INTERVAL} seconds (faster while picks are coming in)")
     print()
     print("⚠️  IMPORTANT: Keep the Numbers document OPEN while monitoring!")
     print("    New picks will be added silently to Draft Results sheet.")
@@ -278,7 +419,7 @@ tell application "Numbers"
 end tell
 '''
     try:
-        res = subprocess.run(["osascript", "-e", check_open], capture_output=True, text=True)
+        res = run_applescript(check_open, timeout=30)
         if res.returncode == 0 and res.stdout.strip() == "CLOSED":
             print()
             print(f"⚠️  WARNING: No Numbers document appears to be open!")
@@ -294,49 +435,10 @@ end tell
     print("🔄 Monitoring... (Press Ctrl+C to stop)")
     print()
 
-    polls = 0
     try:
-        while True:
-            start = time.time()
-            try:
-                # Log each polling cycle so user can see continuous activity in log output
-                LOG.info(f"Polling Yahoo API (check #{polls + 1})...")
-                results = api.get_draft_results() or []
-                polls += 1
-                LOG.info(f"Poll #{polls} complete: total picks returned={len(results)}")
-
-                # Log draft status on first poll
-                if polls == 1:
-                    if results:
-                        print(f"📋 Found {len(results)} total draft picks so far")
-                    else:
-                        print("📋 No draft picks found yet")
-
-                new_rows = collect_new(results)
-
-                if new_rows:
-                    LOG.info(f"Poll #{polls}: {len(new_rows)} new picks detected")
-                    success = append_picks_silently(new_rows)
-                    if success:
-                        for r in new_rows:
-                            print(f"✅ Pick {r[1]}: {r[2]} (Team: {r[3]})")
-                    else:
-                        print(f"⚠️  Error saving {len(new_rows)} draft picks")
-                else:
-                    LOG.info(f"Poll #{polls}: no new picks")
-                    # Show periodic status so user knows it's working
-                    if polls % 6 == 1:  # Every ~60 seconds (6 polls × 10s)
-                        print(f"⏳ Still monitoring... ({polls} checks completed)")
-
-            except Exception as e:
-                print(f"⚠️  Error during check #{polls}: {e}")
-                # Continue monitoring even if one check fails
-
-            remaining = INTERVAL - (time.time() - start)
-            if remaining > 0:
-                time.sleep(remaining)
+        asyncio.run(_monitor())
     except KeyboardInterrupt:
-        print(f"\n🛑 Stopped by user after {polls} checks.")
+        print(f"\n🛑 Stopped by user after {_polls} checks.")
 
 
 if __name__ == "__main__":
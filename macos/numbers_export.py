@@ -1,8 +1,109 @@
 import re
-import os, logging, subprocess, csv, tempfile
+import atexit
+import os, logging, subprocess, csv, tempfile, time
 from typing import List, Dict, Any, Iterable, Tuple
 from datetime import datetime
-from .numbers_helpers import create_sheets, update_sheet, apply_formulas
+from .numbers_helpers import create_sheets, update_sheets, ensure_and_update, apply_formulas, document_ref, run_applescript, _AS_ESCAPE, _sheet_names
+
+
+def _is_numeric_str(s: str) -> bool:
+    """Cheap check for the decimal strings float() accepts, like '12', ' -3.5', '+1.5', '1e3'.
+
+    Signs, surrounding whitespace and an exponent are handled without the float() / exception path.
+    """
+    t = s.strip()
+    if t[:1] in ('+', '-'):
+        t = t[1:]
+    mantissa, e, exponent = t.lower().partition('e')
+    if e:
+        if exponent[:1] in ('+', '-'):
+            exponent = exponent[1:]
+        if not exponent.isdigit():
+            return False
+    return mantissa.replace('.', '', 1).isdigit()
+
+
+# Position separators ("/", ";", " ") normalised to "," in one pass
+_POS_SEP_TBL = str.maketrans("/; ", ",,,")
+
+
+def _numbers_csv_value(val):
+    """Convert decimal separators from dots to commas for Numbers (Swedish locale)."""
+    if isinstance(val, (int, float)):
+        return str(val).replace('.', ',')
+    if isinstance(val, str) and _is_numeric_str(val):
+        return val.replace('.', ',')
+    return val
+
+
+# Parameterised scripts (values arrive via ``on run argv``); compiled once per process, see
+# MacOSDraftExporter._run_template
+_IMPORT_CSV_SCRIPT = '''
+on run argv
+    set targetFile to POSIX file (item 1 of argv)
+    set csvFile to POSIX file (item 2 of argv)
+    set sheetName to item 3 of argv
+    tell application "Numbers"
+        with timeout of 3600 seconds
+            -- Close any existing document with same path
+            repeat with doc in documents
+                try
+                    if path of doc is (targetFile as text) then
+                        close doc saving no
+                    end if
+                end try
+            end repeat
+
+            -- Phase 1: import CSV -> Numbers doc (no formulas yet)
+            set csvDoc to open csvFile
+            delay 0.5
+            tell csvDoc
+                set name of sheet 1 to sheetName
+                tell sheet 1
+                    set name of table 1 to sheetName
+                end tell
+            end tell
+
+            -- Save as target .numbers file and close temp doc
+            try
+                save csvDoc in targetFile
+            on error errMsg number errNum
+                try
+                    close csvDoc saving yes
+                end try
+            end try
+            close csvDoc saving yes
+        end timeout
+    end tell
+end run
+'''
+
+_PREALLOCATE_ROWS_SCRIPT = '''
+on run argv
+    set targetFile to POSIX file (item 1 of argv)
+    set desiredTotal to (item 2 of argv) as integer
+    tell application "Numbers"
+        try
+            set doc to open targetFile
+
+            tell doc
+                if (every sheet whose name is "Draft Results") = {} then return "ERROR: Missing Draft Results"
+                tell sheet "Draft Results"
+                    tell table 1
+                        if (row count) < desiredTotal then
+                            set row count to desiredTotal
+                        end if
+                    end tell
+                end tell
+            end tell
+            save doc
+            return "OK"
+        on error errMsg
+            return "ERROR: " & errMsg
+        end try
+    end tell
+end run
+'''
 
 
 class MacOSDraftExporter:
@@ -16,6 +117,16 @@ class MacOSDraftExporter:
         "Draft Results": ["round", "pick", "playerKey", "teamKey", "manager"],
     }
 
+    # Draft Results col E: manager looked up from Teams by teamKey
+    MANAGER_FORMULA = "=IF(ISERROR(INDEX('Teams'::D;MATCH(D{row};'Teams'::A;0)));\"\";INDEX('Teams'::D;MATCH(D{row};'Teams'::A;0)))"
+
+    # Rows of per-row VORP formulas written per AppleScript invocation
+    VORP_WRITE_CHUNK = 50
+
+    _SCRIPT_TEMPLATES = {"import_csv": _IMPORT_CSV_SCRIPT, "preallocate_rows": _PREALLOCATE_ROWS_SCRIPT}
+    # name -> compiled .scpt path ("" when osacompile failed)
+    _COMPILED_SCRIPTS: Dict[str, str] = {}
+
     def __init__(self, filename: str = "fantasy_draft_data.numbers"):
         # Override parent to use .numbers instead of .xlsx
         if not filename.lower().endswith('.numbers'):
@@ -23,6 +134,56 @@ class MacOSDraftExporter:
 
         self.filename = filename
         self.logger = logging.getLogger(__name__)
+        # Scratch CSV reused by every CSV import (created on first use, removed in __del__)
+        self._csv_path = None
+
+    def __del__(self):
+        if getattr(self, "_csv_path", None):
+            try:
+                os.remove(self._csv_path)
+            except OSError:
+                pass
+
+    def _csv_scratch_path(self) -> str:
+        """Path of the exporter's scratch CSV, created once rather than per import."""
+        if self._csv_path is None:
+            fd, self._csv_path = tempfile.mkstemp(suffix='.csv', prefix='yf_tmp_')
+            os.close(fd)
+        return self._csv_path
+
+    @classmethod
+    def _compiled_script(cls, name: str):
+        """Compile template ``name`` to a .scpt once per process; returns its path or None."""
+        path = cls._COMPILED_SCRIPTS.get(name)
+        if path is None:
+            path = os.path.join(tempfile.gettempdir(), f"yf_{name}_{os.getpid()}.scpt")
+            try:
+                res = subprocess.run(["osacompile", "-o", path, "-e", cls._SCRIPT_TEMPLATES[name]], capture_output=True, text=True, timeout=10)
+                ok = res.returncode == 0
+            except Exception:
+                ok = False
+            path = cls._COMPILED_SCRIPTS[name] = path if ok else ""
+            if ok:
+                atexit.register(cls._remove_compiled, path)
+        return path or None
+
+    @staticmethod
+    def _remove_compiled(path: str):
+        """Delete a compiled .scpt at interpreter exit."""
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _run_template(self, name: str, args: List[str], timeout: int) -> subprocess.CompletedProcess:
+        """Run template ``name`` with ``args`` as argv, from its compiled .scpt when available.
+
+        Skips re-parsing the source on every call; falls back to piping it to ``osascript -``.
+        """
+        compiled = self._compiled_script(name)
+        if compiled:
+            return subprocess.run(["osascript", compiled, *args], capture_output=True, text=True, timeout=timeout)
+        return subprocess.run(["osascript", "-", *args], input=self._SCRIPT_TEMPLATES[name], capture_output=True, text=True, timeout=timeout)
 
     # ---------------------------- Sheet helpers ----------------------------
 
@@ -38,88 +199,31 @@ class MacOSDraftExporter:
 
     def _create_draft_board_with_csv(self, sheet_name: str, headers, rows):
         numbers_abs = os.path.abspath(self.filename)
-        # Create temp CSV
-        fd, temp_path = tempfile.mkstemp(suffix='.csv', prefix='yf_tmp_')
-        os.close(fd)
+        # Overwrite the scratch CSV (truncated on open)
+        temp_path = self._csv_scratch_path()
         try:
-            with open(temp_path, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(headers)
+            n_cols = len(headers)
+            pad = ('',) * n_cols
+
+            def _csv_rows():
                 for r in rows:
                     if r is None:
-                        writer.writerow([''] * len(headers))
+                        yield pad
                         continue
-                    adj = list(r)[:len(headers)]
-                    if len(adj) < len(headers):
-                        adj.extend([''] * (len(headers) - len(adj)))
-                    # Convert decimal separators from dots to commas for Numbers (Swedish locale)
-                    converted_row = []
-                    for val in adj:
-                        if isinstance(val, (int, float)):
-                            # Convert number to string with comma separator
-                            converted_row.append(str(val).replace('.', ','))
-                        elif isinstance(val, str) and val:
-                            # Try to detect if it's a numeric string and convert
-                            try:
-                                float(val)  # Test if it's numeric
-                                converted_row.append(val.replace('.', ','))
-                            except ValueError:
-                                converted_row.append(val)
-                        else:
-                            converted_row.append(val)
-                    writer.writerow(['', ''] + converted_row)
+                    head = r[:n_cols]
+                    yield ('', '', *map(_numbers_csv_value, head), *pad[len(head):])
+
+            with open(temp_path, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(_csv_rows())
         except Exception as e:
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
             raise RuntimeError(f"Failed writing temp CSV: {e}")
 
-        script = f'''
-tell application "Numbers"
-    with timeout of 3600 seconds
-        -- Close any existing document with same path
-        set targetPath to POSIX file "{numbers_abs}"
-        repeat with doc in documents
-            try
-                if path of doc is (targetPath as text) then
-                    close doc saving no
-                end if
-            end try
-        end repeat
-
-        -- Phase 1: import CSV -> Numbers doc (no formulas yet)
-        set csvDoc to open (POSIX file "{temp_path}")
-        delay 0.5
-        tell csvDoc
-            set name of sheet 1 to "{sheet_name}"
-            tell sheet 1
-                set name of table 1 to "{sheet_name}"
-            end tell
-        end tell
-
-        -- Save as target .numbers file and close temp doc
-        try
-            save csvDoc in POSIX file "{numbers_abs}"
-        on error errMsg number errNum
-            try
-                close csvDoc saving yes
-            end try
-        end try
-        close csvDoc saving yes
-    end timeout
-end tell
-'''
-        try:
-            res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=120)
-            if res.returncode != 0:
-                raise RuntimeError(f"AppleScript CSV import failed: {res.stderr.strip() or res.stdout.strip()}")
-            self.logger.debug(f"Replaced sheet {sheet_name} via CSV import ({len(rows)} rows)")
-        finally:
-            try:
-                os.remove(temp_path)
-            except Exception:
-                pass
+        res = self._run_template("import_csv", [numbers_abs, temp_path, sheet_name], timeout=120)
+        if res.returncode != 0:
+            raise RuntimeError(f"AppleScript CSV import failed: {res.stderr.strip() or res.stdout.strip()}")
+        self.logger.debug(f"Replaced sheet {sheet_name} via CSV import ({len(rows)} rows)")
 
 
 
@@ -155,11 +259,16 @@ end tell
             # Formulas (col F) pulling TOTAL from projection sheets
             skater_formula = "=IF(ISERROR(INDEX('Skater Projections'::TOTAL;MATCH(B{row};'Skater Projections'::playerName;0)));\"\";INDEX('Skater Projections'::TOTAL;MATCH(B{row};'Skater Projections'::playerName;0)))"
             goalie_formula = "=IF(ISERROR(INDEX('Goalie Projections'::TOTAL;MATCH(B{row};'Goalie Projections'::playerName;0)));\"\";INDEX('Goalie Projections'::TOTAL;MATCH(B{row};'Goalie Projections'::playerName;0)))"
+            update_sheets(
+                self.filename,
+                self.logger,
+                {f"{pos} Players": rows for pos, rows in pos_map.items() if rows},
+            )
+            last_pos = next((pos for pos in reversed(pos_map) if pos_map[pos]), None)
             for pos, rows in pos_map.items():
                 if not rows:
                     continue
                 sheet_name = f"{pos} Players"
-                update_sheet(self.filename, self.logger, sheet_name, rows)
                 proj_formula = goalie_formula if pos == 'G' else skater_formula
                 # Rank within the sheet (descending). Blank if no projected points.
                 rank_formula = "=IF(F{row}=\"\";\"\";RANK(F{row};F$2:F$1000;0))"
@@ -171,6 +280,9 @@ end tell
                         sheet=sheet_name,
                         per_row=[("F", proj_formula), ("G", rank_formula), ("H", vorp_formula)],
                         start_row=2,
+                        # Save/close once, after the last position sheet
+                        save_on_exit=pos == last_pos,
+                        close_on_exit=pos == last_pos,
                     )
                 except Exception as e:  # pragma: no cover
                     self.logger.debug(f"Apply projectedPoints/rank formulas failed for {sheet_name}: {e}")
@@ -179,44 +291,14 @@ end tell
 
     def update_league_settings_data(self, league_settings: Dict[str, Any]):
         """Populate League Settings sheet with grouped sections using AppleScript."""
-        # Ensure the sheet exists (headers applied once) before attempting updates
-        try:
-            create_sheets(
-                self.filename,
-                self.logger,
-                [("League Settings", self.BASE_SHEETS["League Settings"])],
-                force=False,
-            )
-        except Exception as e:  # pragma: no cover - defensive
-            self.logger.debug(f"League Settings sheet ensure skipped/failed (may already exist): {e}")
-        rows = []
-        rows.append(["League Name", league_settings.get('league_name', '')])
-        rows.append(["League Type", league_settings.get('league_type', '')])
-        rows.append(["Scoring Type", league_settings.get('scoring_type', '')])
-        rows.append(["Max Teams", league_settings.get('max_teams', '')])
-        rows.append(["Playoff Teams", league_settings.get('num_playoff_teams', '')])
-        rows.append(["Playoff Start Week", league_settings.get('playoff_start_week', '')])
-        rows.append(["", ""])
-        rows.append(["ROSTER POSITIONS", "COUNT"])
-        for pos in league_settings.get('roster_positions', []):
-            rows.append([pos.get('position', ''), pos.get('count', '')])
-        rows.append(["", ""])
-        rows.append(["SKATER STATS", "VALUE"])
+        roster_positions = league_settings.get('roster_positions', [])
+        skater_stats, goalie_stats = [], []
         for stat in league_settings.get('stat_categories', []):
-            if stat.get('position_type') == 'P':
-                name = stat.get('display_name') or stat.get('name') or ''
-                rows.append([name, stat.get('value', '')])
-        rows.append(["", ""])
-        rows.append(["GOALIE STATS", "VALUE"])
-        for stat in league_settings.get('stat_categories', []):
-            if stat.get('position_type') == 'G':
-                name = stat.get('display_name') or stat.get('name') or ''
-                rows.append([name, stat.get('value', '')])
-
-        rows.append(["", ""])
-        # VORP baselines section (total roster slots per position = count * max_teams)
-        rows.append(["VORP BASELINES", "VALUE"])
-        max_teams_raw = league_settings.get('max_teams', 0)
+            ptype = stat.get('position_type')
+            if ptype == 'P':
+                skater_stats.append([stat.get('display_name') or stat.get('name') or '', stat.get('value', '')])
+            elif ptype == 'G':
+                goalie_stats.append([stat.get('display_name') or stat.get('name') or '', stat.get('value', '')])
 
         def _as_int(v):
             try:
@@ -226,29 +308,41 @@ end tell
             except (ValueError, TypeError):
                 return 0
 
-        max_teams = _as_int(max_teams_raw)
-        for pos in league_settings.get('roster_positions', []):
-            p_code = "VORP_" + pos.get('position', '')
+        # VORP baselines section (total roster slots per position = count * max_teams)
+        max_teams = _as_int(league_settings.get('max_teams', 0))
+        vorp_rows = []
+        for pos in roster_positions:
             count = _as_int(pos.get('count', 0))
-            total_slots = count * max_teams if count and max_teams else ''
-            rows.append([p_code, total_slots])
-        update_sheet(self.filename, self.logger, "League Settings", rows)
+            vorp_rows.append(["VORP_" + pos.get('position', ''), count * max_teams if count and max_teams else ''])
+
+        rows = [
+            ["League Name", league_settings.get('league_name', '')],
+            ["League Type", league_settings.get('league_type', '')],
+            ["Scoring Type", league_settings.get('scoring_type', '')],
+            ["Max Teams", league_settings.get('max_teams', '')],
+            ["Playoff Teams", league_settings.get('num_playoff_teams', '')],
+            ["Playoff Start Week", league_settings.get('playoff_start_week', '')],
+            ["", ""],
+            ["ROSTER POSITIONS", "COUNT"],
+            *([pos.get('position', ''), pos.get('count', '')] for pos in roster_positions),
+            ["", ""],
+            ["SKATER STATS", "VALUE"],
+            *skater_stats,
+            ["", ""],
+            ["GOALIE STATS", "VALUE"],
+            *goalie_stats,
+            ["", ""],
+            ["VORP BASELINES", "VALUE"],
+            *vorp_rows,
+        ]
+        # Sheet ensure (headers applied once) + data write share one AppleScript run
+        ensure_and_update(self.filename, self.logger, "League Settings", self.BASE_SHEETS["League Settings"], rows)
 
     def update_teams_data(self, teams_rows):
         """Write Teams sheet data using AppleScript."""
         if not teams_rows:
             return
-        # Ensure Teams sheet exists first
-        try:
-            create_sheets(
-                self.filename,
-                self.logger,
-                [("Teams", self.BASE_SHEETS["Teams"])],
-                force=False,
-            )
-        except Exception as e:  # pragma: no cover - defensive
-            self.logger.debug(f"Teams sheet ensure skipped/failed (may already exist): {e}")
-        update_sheet(self.filename, self.logger, "Teams", teams_rows)
+        ensure_and_update(self.filename, self.logger, "Teams", self.BASE_SHEETS["Teams"], teams_rows)
 
     def update_draft_results_data(self, draft_results):
         """Write Draft Results sheet data (round, pick, playerKey, teamKey, manager(lookup)).
@@ -263,16 +357,6 @@ end tell
             except Exception as e:  # pragma: no cover - defensive
                 self.logger.debug(f"Preallocation of Draft Results rows skipped/failed: {e}")
             return
-        try:
-            create_sheets(
-                self.filename,
-                self.logger,
-                [("Draft Results", self.BASE_SHEETS["Draft Results"])],
-                force=False,
-            )
-        except Exception as e:  # pragma: no cover
-            self.logger.debug(f"Draft Results sheet ensure skipped/failed (may already exist): {e}")
-
         rows = []
         for entry in draft_results:
             rnd = entry.get("round", "")
@@ -283,21 +367,16 @@ end tell
             rows.append([rnd, pick, player_key, team_key, ""])
 
         if rows:
-            update_sheet(self.filename, self.logger, "Draft Results", rows)
-            # Apply manager lookup formulas after data insert
-            self._apply_draft_results_formulas()
-
+            # Sheet ensure, data insert and manager lookup formulas (col E) in one AppleScript run
+            ensure_and_update(
+                self.filename,
+                self.logger,
+                "Draft Results",
+                self.BASE_SHEETS["Draft Results"],
+                rows,
+                per_row=[("E", self.MANAGER_FORMULA)],
+            )
 
-    def _apply_draft_results_formulas(self):
-        """Use generic helper to apply manager lookup (col E)."""
-        manager_formula = "=IF(ISERROR(INDEX('Teams'::D;MATCH(D{row};'Teams'::A;0)));\"\";INDEX('Teams'::D;MATCH(D{row};'Teams'::A;0)))"
-        apply_formulas(
-            self.filename,
-            self.logger,
-            sheet="Draft Results",
-            per_row=[("E", manager_formula)],
-            start_row=2,
-        )
 
     def _preallocate_draft_results_rows(self, target_rows: int = 1000):
         """Ensure Draft Results sheet has header + target_rows data rows (default 1000).
@@ -309,43 +388,8 @@ end tell
         numbers_abs = os.path.abspath(self.filename)
         # +1 because row 1 is headers
         desired_total = target_rows + 1
-        script = f'''
-tell application "Numbers"
-    try
-        -- Open document if not already open
-        set doc to missing value
-        repeat with d in documents
-            if path of d is "{numbers_abs}" then
-                set doc to d
-                exit repeat
-            end if
-        end repeat
-        if doc is missing value then
-            set doc to open (POSIX file "{numbers_abs}")
-        end if
-
-        tell doc
-            if (every sheet whose name is "Draft Results") = {{}} then return "ERROR: Missing Draft Results"
-            tell sheet "Draft Results"
-                tell table 1
-                    set currentRows to row count
-                    if currentRows < {desired_total} then
-                        repeat ({desired_total} - currentRows) times
-                            add row below last row
-                        end repeat
-                    end if
-                end tell
-            end tell
-        end tell
-        save doc
-        return "OK"
-    on error errMsg
-        return "ERROR: " & errMsg
-    end try
-end tell
-'''
         try:
-            res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=40)
+            res = self._run_template("preallocate_rows", [numbers_abs, str(desired_total)], timeout=40)
             out = (res.stdout or "").strip()
             if out.startswith("ERROR:"):
                 self.logger.debug(f"Draft Results preallocation AppleScript error: {out}")
@@ -383,27 +427,18 @@ end tell
         read_script = f'''
 tell application "Numbers"
     with timeout of 3600 seconds
-        set doc to missing value
-        set targetFile to POSIX file "{numbers_abs}"
-        repeat with d in documents
-            try
-                if (path of d) is targetFile then
-                    set doc to d
-                    exit repeat
-                end if
-            end try
-        end repeat
-        if doc is missing value then
-            set doc to open targetFile
-        end if
+        {document_ref(numbers_abs)}
         if (every sheet of doc whose name is "Draft Board") = {{}} then return ""
         set outList to {{}}
         tell sheet "Draft Board" of doc
             tell table 1
-                set rc to row count
+                -- Whole columns in two Apple Events instead of two per row
+                set pkVals to value of cells of column 3
+                set posVals to value of cells of column 6
+                set rc to count of pkVals
                 repeat with r from 2 to rc
-                    set pk to value of cell 3 of row r
-                    set posStr to value of cell 6 of row r
+                    set pk to item r of pkVals
+                    set posStr to item r of posVals
                     if (pk is missing value or pk = "") and (posStr is missing value or posStr = "") then
                         -- skip empty line
                     else
@@ -414,19 +449,20 @@ tell application "Numbers"
                 end repeat
             end tell
         end tell
-        return outList
+        -- One line per row: plain text reads back the same from osascript and OSAKit
+        set {{otid, AppleScript's text item delimiters}} to {{AppleScript's text item delimiters, linefeed}}
+        set outText to outList as text
+        set AppleScript's text item delimiters to otid
+        return outText
     end timeout
 end tell
 '''
-        res = subprocess.run(["osascript", "-e", read_script], capture_output=True, text=True, timeout=90)
+        res = run_applescript(read_script, timeout=90)
         if res.returncode != 0:
             self.logger.debug(f"Read Draft Board rows AppleScript stderr={res.stderr.strip()}")
             return
 
-        raw = (res.stdout or "").strip()
-        if raw.startswith("{") and raw.endswith("}"):
-            raw = raw[1:-1]
-        entries = [e.strip() for e in raw.split(", ") if e.strip()]
+        entries = [e.strip() for e in (res.stdout or "").splitlines() if e.strip()]
         if not entries:
             self.logger.debug("No Draft Board rows found for VORP formula generation")
             return
@@ -444,7 +480,7 @@ end tell
             pos_str = parts[2].strip()
             if not player_key or not pos_str:
                 continue
-            norm = pos_str.replace("/", ",").replace(";", ",").replace(" ", ",")
+            norm = pos_str.translate(_POS_SEP_TBL)
             tokens_raw = [t.strip() for t in norm.split(",") if t.strip()]
             seen = set()
             positions = []
@@ -460,52 +496,73 @@ end tell
             self.logger.debug("No per-row VORP formulas constructed (positions missing)")
             return
 
-        write_chunks = []
-        for r, fmla in row_formula_map.items():
-            esc = fmla.replace('"', '\\"')
-            write_chunks.append(f'''
+        # One translate per formula escapes backslashes and quotes together
+        write_chunks = [
+            f'''
                 try
                     tell row {r}
                         tell cell 9
-                            set value to "{esc}"
+                            set value to "{fmla.translate(_AS_ESCAPE)}"
                         end tell
                     end tell
-                end try''')
+                end try'''
+            for r, fmla in row_formula_map.items()
+        ]
 
-        write_body = "\n".join(write_chunks)
-        write_script = f'''
+        # Parse time grows faster than script length, so write in fixed-size slices
+        # rather than one script covering the whole board. Save only after the last one.
+        chunk_size = self.VORP_WRITE_CHUNK
+        total_chunks = (len(write_chunks) + chunk_size - 1) // chunk_size
+        for chunk_num, i in enumerate(range(0, len(write_chunks), chunk_size), start=1):
+            write_body = "\n".join(write_chunks[i:i + chunk_size])
+            save_stmt = "save doc" if chunk_num == total_chunks else ""
+            write_script = f'''
 tell application "Numbers"
     with timeout of 3600 seconds
-        set targetFile to POSIX file "{numbers_abs}"
-        set doc to missing value
-        repeat with d in documents
-            try
-                if (path of d) is targetFile then
-                    set doc to d
-                    exit repeat
-                end if
-            end try
-        end repeat
-        if doc is missing value then
-            set doc to open targetFile
-        end if
+        {document_ref(numbers_abs)}
         if (every sheet of doc whose name is "Draft Board") = {{}} then return "ERROR: Missing Draft Board"
         tell sheet "Draft Board" of doc
             tell table 1
 {write_body}
             end tell
         end tell
-        save doc
+        {save_stmt}
         return "OK"
     end timeout
 end tell
 '''
-        res2 = subprocess.run(["osascript", "-e", write_script], capture_output=True, text=True, timeout=180)
-        if res2.returncode != 0:
-            self.logger.debug(f"Write VORP formulas AppleScript stderr={res2.stderr.strip()}")
-            return
+            started = time.perf_counter()
+            try:
+                res2 = run_applescript(write_script, timeout=180)
+                error = res2.stderr.strip() if res2.returncode != 0 else None
+            except subprocess.TimeoutExpired:
+                error = "timeout"
+            if error is not None:
+                self.logger.error(f"Writing VORP formulas chunk {chunk_num}/{total_chunks} failed: {error}")
+                if chunk_num > 1:
+                    # Earlier chunks are already in the document; don't leave them unsaved
+                    self._save_document(numbers_abs)
+                return
+            self.logger.debug(
+                f"VORP formulas chunk {chunk_num}/{total_chunks} written in {time.perf_counter() - started:.2f}s"
+            )
         self.logger.debug(f"Applied VORP formulas to {len(row_formula_map)} rows (col I)")
 
+    def _save_document(self, numbers_abs: str) -> None:
+        """Save the open document, e.g. after a chunked write stopped before its final save."""
+        script = f'''
+tell application "Numbers"
+    {document_ref(numbers_abs)}
+    save doc
+end tell
+'''
+        try:
+            res = run_applescript(script, timeout=60)
+            if res.returncode != 0:
+                self.logger.error(f"Saving {self.filename} failed: {res.stderr.strip()}")
+        except subprocess.TimeoutExpired:
+            self.logger.error(f"Timeout saving {self.filename}")
+
     def _build_vorp_formula_for_positions(self, positions: List[str], row: int) -> str:
         """Return per‑row VORP formula choosing VORP from the sheet where rank (col G) is lowest.
         Uses INDEX/MATCH everywhere (no LOOKUP) for exact match reliability.
@@ -536,8 +593,16 @@ end tell
 
 
 
-    def setup_projection_sheets(self, league_settings):
-        """Create Skater/Goalie Projections sheets with TOTAL formulas using bulk creation."""
+    def has_sheets(self, names) -> bool:
+        """True if every sheet in ``names`` exists in the document (False if it can't be read)."""
+        existing = _sheet_names(os.path.abspath(self.filename))
+        return existing is not None and set(names) <= existing
+
+    def setup_projection_sheets(self, league_settings) -> bool:
+        """Create Skater/Goalie Projections sheets with TOTAL formulas using bulk creation.
+
+        Returns True only if the sheets and their formulas were all written.
+        """
         try:
             skater_stats: List[str] = []
             goalie_stats: List[str] = []
@@ -557,21 +622,27 @@ end tell
             if goalie_stats:
                 sheets_to_create.append(("Goalie Projections", ["playerName"] + goalie_stats + ["TOTAL"]))
 
+            ok = True
             if sheets_to_create:
-                create_sheets(self.filename, self.logger, sheets_to_create)
+                ok = create_sheets(self.filename, self.logger, sheets_to_create)
 
-            if skater_stats:
-                self._setup_total_formulas("Skater Projections", skater_stats, league_settings)
-            if goalie_stats:
-                self._setup_total_formulas("Goalie Projections", goalie_stats, league_settings)
+            if ok and skater_stats:
+                ok = self._setup_total_formulas("Skater Projections", skater_stats, league_settings)
+            if ok and goalie_stats:
+                ok = self._setup_total_formulas("Goalie Projections", goalie_stats, league_settings)
+            return ok
 
         except Exception as e:
             self.logger.error(f"Error setting up projection sheets: {e}")
+            return False
+
+    def _setup_total_formulas(self, sheet_name: str, stat_names, league_settings) -> bool:
+        """Set up TOTAL column formulas for projection sheets; False if they couldn't be applied.
 
-    def _setup_total_formulas(self, sheet_name: str, stat_names, league_settings):
-        """Set up TOTAL column formulas for projection sheets."""
+        A single row template (``{row}`` placeholder) is handed to ``apply_formulas`` so one
+        AppleScript covers rows 2-101 instead of recompiling a wrapper per 25-row batch.
+        """
         try:
-            numbers_abs = os.path.abspath(self.filename)
             ptype = 'G' if 'Goalie' in sheet_name else 'P'
 
             # Build stat values map
@@ -584,78 +655,31 @@ end tell
                     except Exception:
                         values[name] = 0
 
-            # Calculate TOTAL column index (playerName + stats + TOTAL)
-            total_col_index = len(stat_names) + 2
+            # TOTAL column follows playerName + stats
+            total_col_letter = chr(64 + len(stat_names) + 2)
 
-            # Build formula for TOTAL column
-            # Format: =B2*value1+C2*value2+D2*value3...
+            # Format: =B{row}*value1+C{row}*value2+... (Numbers uses comma as decimal separator)
             formula_parts = []
             for i, stat_name in enumerate(stat_names):
                 val = values.get(stat_name, 0)
                 if val:
                     col_letter = chr(66 + i)  # B, C, D, etc.
-                    formula_parts.append(f"{col_letter}2*{val}")
+                    formula_parts.append(f"{col_letter}{{row}}*{str(val).replace('.', ',')}")
 
             if not formula_parts:
-                return
+                return True
 
-            # Build formula commands for each row
-            formula_commands = []
-            for row_num in range(2, 102):  # Rows 2-101 (100 rows)
-                # Build formula for this row
-                row_formula_parts = []
-                for i, stat_name in enumerate(stat_names):
-                    val = values.get(stat_name, 0)
-                    if val:
-                        col_letter = chr(66 + i)  # B, C, D, etc.
-                        # Numbers uses comma as decimal separator
-                        val_str = str(val).replace('.', ',')
-                        row_formula_parts.append(f"{col_letter}{row_num}*{val_str}")
-
-                if row_formula_parts:
-                    row_formula = "+".join(row_formula_parts)
-                    formula_commands.append(f'tell cell {total_col_index} of row {row_num}')
-                    formula_commands.append(f'    set formulaStr to "=" & "{row_formula}"')
-                    formula_commands.append(f'    set its value to formulaStr')
-                    formula_commands.append(f'end tell')
-
-            # Apply formulas in batches
-            batch_size = 25  # 25 rows at a time
-            lines_per_row = 4
-            total_batches = (100 + batch_size - 1) // batch_size
-
-            for batch_num in range(total_batches):
-                start_idx = batch_num * batch_size * lines_per_row
-                end_idx = start_idx + (batch_size * lines_per_row)
-                batch = formula_commands[start_idx:end_idx]
-                formulas_script = '\n                    '.join(batch)
-
-                script = f'''
-tell application "Numbers"
-    try
-        set doc to open (POSIX file "{numbers_abs}")
-        tell doc
-            tell sheet "{sheet_name}"
-                tell table 1
-                    {formulas_script}
-                end tell
-            end tell
-        end tell
-        save doc
-        close doc
-    on error errorMessage
-        return "ERROR: " & errorMessage
-    end try
-end tell
-'''
-
-                res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=60)
-                if res.returncode != 0:
-                    self.logger.error(f"Failed to set TOTAL formulas for {sheet_name} batch {batch_num + 1}: {res.stderr}")
-                else:
-                    self.logger.debug(f"Set TOTAL formulas for {sheet_name} batch {batch_num + 1}/{total_batches}")
+            return apply_formulas(
+                self.filename,
+                self.logger,
+                sheet=sheet_name,
+                per_row=[(total_col_letter, "=" + "+".join(formula_parts))],
+                start_row=2,
+                end_row=101,  # Rows 2-101 (100 rows)
+            )
         except Exception as e:
             self.logger.error(f"Error setting TOTAL formulas for {sheet_name}: {e}")
+            return False
 
 
 
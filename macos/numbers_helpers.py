@@ -8,9 +8,468 @@ around osascript calls; higher-level code should handle data preparation.
 from __future__ import annotations
 
 import os
+import queue
 import subprocess
 import logging
-from typing import List, Any, Iterable, Tuple
+import tempfile
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait
+from functools import lru_cache
+from itertools import islice
+from typing import List, Any, Iterable, Tuple, Dict, Optional, Sequence
+
+try:  # Optional: in-process AppleScript through PyObjC (pyobjc-framework-OSAKit)
+    from OSAKit import OSAScript  # type: ignore
+except Exception:  # pragma: no cover - PyObjC not installed / not macOS
+    OSAScript = None
+
+
+# In-process scripts run on one daemon thread: OSAScript objects stay on the thread that made
+# them, and a run stuck in Numbers can't hold up interpreter exit.
+_osa_queue: "queue.Queue" = queue.Queue()
+_osa_thread: Optional[threading.Thread] = None
+_osa_last: Optional[Future] = None  # future of the latest in-process run
+# Set once an in-process run overruns its timeout; osascript (killable) is used from then on
+_osa_disabled = False
+# Scripts up to this size (the fixed queries / templates) are compiled once and reused
+_OSA_CACHE_MAX_CHARS = 8192
+
+
+def _osa_result(result, error) -> subprocess.CompletedProcess:
+    if error is not None:
+        message = error.get("OSAScriptErrorMessageKey") or error.get("NSAppleScriptErrorMessage") or error
+        return subprocess.CompletedProcess(["OSAKit"], 1, "", str(message))
+    text = result.stringValue() if result is not None else None
+    return subprocess.CompletedProcess(["OSAKit"], 0, f"{text or ''}\n", "")
+
+
+@lru_cache(maxsize=32)
+def _compiled_osa(script: str):
+    """``(OSAScript, compile_error)`` for ``script``, compiled once; OSAKit thread only."""
+    osa = OSAScript.alloc().initWithSource_(script)
+    ok, error = osa.compileAndReturnError_(None)
+    return osa, (None if ok else error)
+
+
+def _run_osa(script: str, handler: Optional[str], args: Sequence[str]) -> subprocess.CompletedProcess:
+    if len(script) <= _OSA_CACHE_MAX_CHARS:
+        osa, error = _compiled_osa(script)
+        if error is not None:
+            return _osa_result(None, error)
+    else:
+        osa = OSAScript.alloc().initWithSource_(script)
+    if handler is not None:
+        return _osa_result(*osa.executeHandlerWithName_arguments_error_(handler, list(args), None))
+    return _osa_result(*osa.executeAndReturnError_(None))
+
+
+def _osa_worker() -> None:
+    while True:
+        future, job = _osa_queue.get()
+        if not future.set_running_or_notify_cancel():
+            continue
+        try:
+            future.set_result(_run_osa(*job))
+        except BaseException as e:  # pragma: no cover - defensive
+            future.set_exception(e)
+
+
+def _osa_submit(script: str, handler: Optional[str], args: Sequence[str]) -> Future:
+    global _osa_thread
+    if _osa_thread is None:
+        _osa_thread = threading.Thread(target=_osa_worker, name="osakit", daemon=True)
+        _osa_thread.start()
+    future: Future = Future()
+    _osa_queue.put((future, (script, handler, args)))
+    return future
+
+
+def run_applescript(script: str, timeout: float, args: Sequence[str] = (),
+                    handler: Optional[str] = None) -> subprocess.CompletedProcess:
+    """Run ``script`` and return a ``CompletedProcess`` (returncode / stdout / stderr).
+
+    ``args`` reach the script's ``on run argv``; with ``handler`` the in-process path calls
+    that handler with ``args`` directly, so its ``run`` handler should just forward to it.
+
+    When OSAKit is importable the script runs in-process on a dedicated thread, skipping the
+    osascript fork/exec and AppleScript start-up per call (short scripts are also compiled
+    only once); otherwise the source is piped to ``osascript -`` on stdin, which avoids
+    copying multi-MB scripts through argv (ARG_MAX). ``timeout`` applies to both paths and
+    raises ``subprocess.TimeoutExpired``. An in-process run can't be killed, so after one
+    overruns, later calls first wait for it to finish (it may still be writing to Numbers)
+    and then use osascript for the rest of the process.
+    """
+    global _osa_last, _osa_disabled
+    if _osa_last is not None and not _osa_last.done():
+        if not wait([_osa_last], timeout=timeout).done:
+            raise subprocess.TimeoutExpired("OSAKit", timeout)
+    if OSAScript is not None and not _osa_disabled:
+        _osa_last = future = _osa_submit(script, handler, args)
+        try:
+            return future.result(timeout=timeout)
+        except FutureTimeoutError:
+            _osa_disabled = True
+            raise subprocess.TimeoutExpired("OSAKit", timeout) from None
+    return subprocess.run(["osascript", "-", *args], input=script, capture_output=True, text=True, timeout=timeout)
+
+
+def document_ref(numbers_abs: str) -> str:
+    """Return an AppleScript statement binding ``doc`` to the document at ``numbers_abs``.
+
+    Numbers' ``open`` hands back the already-open document for the same file, so a
+    single Apple Event replaces scanning ``documents`` and comparing paths one by one.
+    """
+    return f'set doc to open (POSIX file "{numbers_abs}")'
+
+
+# Escape a value for an AppleScript string literal: backslash and quote, in one C-level pass
+_AS_ESCAPE = str.maketrans({'\\': '\\\\', '"': '\\"'})
+
+
+def _ensure_sheet_snippet(sheet_name: str, headers: List[Any], force: bool = False) -> str:
+    """AppleScript (inside ``tell doc``) creating ``sheet_name`` if missing and writing its headers.
+
+    If the sheet already exists and ``force`` is False, its headers are left untouched.
+    """
+    safe_sheet = str(sheet_name).translate(_AS_ESCAPE)
+    header_cmds = []
+    for i, header in enumerate(headers, 1):
+        escaped_header = str(header).translate(_AS_ESCAPE)
+        header_cmds.append(f'set value of cell {i} of row 1 to "{escaped_header}"')
+    headers_script = '\n                        '.join(header_cmds)
+
+    # targetSheet variable is reused per snippet safely (scoped inside tell doc)
+    return f'''
+            -- Ensure sheet "{safe_sheet}"
+            set sheetExists to (name of sheets) contains "{safe_sheet}"
+            if sheetExists then
+                set targetSheet to sheet "{safe_sheet}"
+            else
+                set targetSheet to make new sheet
+                set name of targetSheet to "{safe_sheet}"
+            end if
+            tell targetSheet
+                -- Ensure predictable table name
+                set name of table 1 to "{safe_sheet}"
+                tell table 1
+                    if {str(force).lower()} or (not sheetExists) then
+                        set column count to {len(headers)}
+                        {headers_script}
+                    end if
+                end tell
+            end tell
+        '''
+
+
+# Row / cell separators for the packed payload (ASCII record / unit separator)
+_ROW_SEP = '\x1e'
+_CELL_SEP = '\x1f'
+
+# Escape backslashes/quotes and turn newlines (not allowed raw in a literal) into spaces,
+# in one pass over an already packed payload
+_QUOTE_TBL = str.maketrans({'\\': '\\\\', '"': '\\"', '\n': ' ', '\r': ' '})
+
+
+def _rows_payload(data_rows, escape: bool = True) -> str:
+    """Pack rows into ONE AppleScript string literal body (rows / cells joined by RS / US).
+
+    The parser lexes a single string token no matter how many cells there are, whereas a
+    list-of-lists literal costs it several tokens per cell. ``split_text`` unpacks it at run
+    time. Each cell is truncated to 100 chars. ``escape=False`` skips literal escaping for
+    payloads read from a file.
+    """
+    # Whole-payload operations: each row is joined by a serializer specialised for its width,
+    # and escaping is one translate over the finished payload instead of a check per cell.
+    packed_rows: list[str] = []
+    append = packed_rows.append
+    all_str = True  # most sheets are all-text; drop to the generic serializer on the first miss
+    for row in data_rows:
+        row = row or ()
+        if all_str:
+            try:
+                row_text = _row_serializer(len(row), True)(row)
+            except TypeError:  # None / number cell
+                all_str = False
+        if not all_str:
+            row_text = _row_serializer(len(row))(row)
+        if _ROW_SEP in row_text or row_text.count(_CELL_SEP) > max(len(row) - 1, 0):
+            # A separator inside a cell: blank it per cell before joining (rare)
+            row_text = _CELL_SEP.join(
+                ('' if cell is None else str(cell)[:100]).replace(_ROW_SEP, ' ').replace(_CELL_SEP, ' ')
+                for cell in row
+            )
+        append(row_text)
+    payload = _ROW_SEP.join(packed_rows)
+    if escape and ('"' in payload or '\\' in payload or '\n' in payload or '\r' in payload):
+        payload = payload.translate(_QUOTE_TBL)
+    return payload
+
+
+@lru_cache(maxsize=None)
+def _row_serializer(width: int, all_str: bool = False):
+    """Generate (once per row width) a straight-line function packing a row of ``width`` cells.
+
+    Sheets have a handful of fixed widths, so unrolling the cell loop into one concatenation
+    expression removes the per-cell loop dispatch from the hot path. The ``all_str`` variant
+    slices cells directly (no None check / ``str()`` call) and raises TypeError on any
+    non-string cell, so callers can fall back to the generic one.
+    """
+    if width == 0:
+        return lambda row: ''
+    if all_str:
+        cells = " + SEP + ".join(f"row[{i}][:100]" for i in range(width))
+    else:
+        cells = " + SEP + ".join(f"('' if row[{i}] is None else str(row[{i}])[:100])" for i in range(width))
+    namespace = {"SEP": _CELL_SEP}
+    exec(compile(f"def serialize(row):\n    return {cells}\n", f"<row_serializer_{width}{'_str' if all_str else ''}>", "exec"), namespace)
+    return namespace["serialize"]
+
+
+# Chunks with more rows than this are read from a temp file instead of a script literal
+_FILE_PAYLOAD_MIN_ROWS = 20
+
+
+def _spill_payload(payload: str) -> str:
+    """Write a packed payload to a temp file and return its path (removed by ``_run_script``)."""
+    fd, path = tempfile.mkstemp(suffix='.txt', prefix='yf_rows_')
+    with os.fdopen(fd, 'w', encoding='utf-8') as f:
+        f.write(payload)
+    return path
+
+
+def _write_rows_snippet(sheet_name: str, data_rows, start_row: int, max_cols: int, spill: Optional[List[str]] = None) -> str:
+    """AppleScript (inside ``tell doc``) writing ``data_rows`` into ``sheet_name`` from ``start_row``.
+
+    Expands the table column count if incoming data has more columns than existing and adds
+    any missing rows before writing; the column limit is read once rather than per cell.
+    When ``spill`` is given and the chunk is large, the unescaped payload is written to a temp
+    file (path appended to ``spill``) and read back in one go by ``read_payload``, so the
+    AppleScript compiler never lexes the bulk data.
+    Requires the ``split_text`` handler (``_SPLIT_TEXT_HANDLER``) at script top level, plus
+    ``_READ_PAYLOAD_HANDLER`` when spilling.
+    """
+    safe_sheet = sheet_name.translate(_AS_ESCAPE)
+    if spill is not None and len(data_rows) > _FILE_PAYLOAD_MIN_ROWS:
+        path = _spill_payload(_rows_payload(data_rows, escape=False))
+        spill.append(path)
+        payload_expr = f'my read_payload("{path.translate(_AS_ESCAPE)}")'
+    else:
+        payload_expr = f'"{_rows_payload(data_rows)}"'
+    last_row = start_row + len(data_rows) - 1
+    return f'''
+            tell sheet "{safe_sheet}"
+                tell table 1
+                    if (column count) < {max_cols} then
+                        set column count to {max_cols}
+                    end if
+                    set colLimit to column count
+                    -- Grow the table once (single resize) instead of adding rows one by one
+                    if (row count) < {last_row} then
+                        set row count to {last_row}
+                    end if
+                    set dataRows to my split_text({payload_expr}, 30)
+                    set rowIndex to {start_row}
+                    repeat with rowText in dataRows
+                        set rowData to my split_text(contents of rowText, 31)
+                        tell row rowIndex
+                            set colIndex to 1
+                            repeat with cellValue in rowData
+                                if colIndex > colLimit then exit repeat
+                                try
+                                    set value of cell colIndex to cellValue
+                                end try
+                                set colIndex to colIndex + 1
+                            end repeat
+                        end tell
+                        set rowIndex to rowIndex + 1
+                    end repeat
+                end tell
+            end tell'''
+
+
+def _per_row_formulas_snippet(per_row, start_row: int) -> str:
+    """AppleScript (inside ``tell table``) applying ``per_row`` templates from ``start_row`` to ``rowLimit``.
+
+    Each template is compiled in Python into a concatenation expression around the row
+    number (``"=A" & rs & "*2"``), so AppleScript does no text substitution per row.
+    """
+    per_row_cmds = []
+    for col, formula in per_row:
+        if not formula.startswith("="):
+            formula = "=" + formula
+        esc = formula.translate(_AS_ESCAPE)
+        expr = ' & rs & '.join(f'"{piece}"' for piece in esc.split("{row}"))
+        per_row_cmds.append(f'''
+                            set value of cell ("{col}" & rs) to {expr}''')
+    return f'''
+                        repeat with r from {start_row} to rowLimit
+                            set rs to r as text{''.join(per_row_cmds)}
+                        end repeat'''
+
+
+# The handler lives at script top level so "text items" / "character id" resolve to AppleScript's
+# own terminology rather than the Numbers dictionary of an enclosing tell block.
+_SPLIT_TEXT_HANDLER = '''
+on split_text(t, sepId)
+    set {otid, AppleScript's text item delimiters} to {AppleScript's text item delimiters, character id sepId}
+    set parts to text items of t
+    set AppleScript's text item delimiters to otid
+    return parts
+end split_text
+'''
+
+_READ_PAYLOAD_HANDLER = '''
+on read_payload(p)
+    return read (POSIX file p) as «class utf8»
+end read_payload
+'''
+
+
+def _max_cols(rows) -> int:
+    """Widest row in ``rows`` (0 if there are none)."""
+    return max((len(r) for r in rows if r is not None), default=0)
+
+
+class _NumbersSession:
+    """Queue work against ONE document and run it as a single script with one open/save.
+
+    The document preamble (``document_ref``) and handlers are emitted once per run rather
+    than once per helper call, so a caller combining sheet creation, row writes and
+    formulas pays for a single osascript invocation and a single package save.
+    """
+
+    def __init__(self, filename: str, logger: logging.Logger, timeout: int = 120):
+        self.numbers_abs = os.path.abspath(filename)
+        self.logger = logger
+        self.timeout = timeout
+        self._snippets: List[str] = []
+        self._handlers: List[str] = []
+        # Temp payload files referenced by the queued snippets
+        self.files: List[str] = []
+
+    def _need(self, handler: str) -> None:
+        if handler not in self._handlers:
+            self._handlers.append(handler)
+
+    def ensure_sheets(self, sheets: Iterable[Tuple[str, List[Any]]], force: bool = False) -> "_NumbersSession":
+        for name, headers in sheets:
+            self._snippets.append(_ensure_sheet_snippet(name, headers, force))
+        return self
+
+    def write_chunk(self, sheet: str, data_rows: List[List[Any]], start_row: int = 2, max_cols: int = 0) -> bool:
+        """Queue a row write; returns False (queuing nothing) for an empty chunk.
+
+        ``max_cols`` is the sheet's known column count; when omitted it is derived from the rows.
+        """
+        if not data_rows:
+            return False
+        if not max_cols:
+            max_cols = _max_cols(data_rows)
+            if not max_cols:  # all rows None / empty
+                return False
+        spilled = len(self.files)
+        self._snippets.append(_write_rows_snippet(sheet, data_rows, start_row, max_cols, self.files))
+        self._need(_SPLIT_TEXT_HANDLER)
+        if len(self.files) > spilled:
+            self._need(_READ_PAYLOAD_HANDLER)
+        return True
+
+    def apply_formulas(self, sheet: str, per_row: list, start_row: int = 2) -> "_NumbersSession":
+        """Queue ``per_row`` templates from ``start_row`` to the table's current row count."""
+        safe_sheet = sheet.translate(_AS_ESCAPE)
+        self._snippets.append(f'''
+            tell sheet "{safe_sheet}"
+                tell table 1
+                        set rowLimit to row count{_per_row_formulas_snippet(per_row, start_row)}
+                end tell
+            end tell''')
+        return self
+
+    def __len__(self) -> int:
+        return len(self._snippets)
+
+    def script(self, close: bool = False, save: bool = True) -> str:
+        all_snippets = '\n'.join(self._snippets)
+        close_cmd = ("\n            save doc" if save else "") + ("\n            close doc" if close else "")
+        return f'''
+tell application "Numbers"
+    with timeout of {self.timeout} seconds
+        try
+            {document_ref(self.numbers_abs)}
+            tell doc
+{all_snippets}
+            end tell{close_cmd}
+            return "OK"
+        on error errorMessage
+            return "ERROR: " & errorMessage
+        end try
+    end timeout
+end tell
+{''.join(self._handlers)}'''
+
+    def run(self, label: str, close: bool = False) -> bool:
+        """Execute the queued work; ``label`` identifies it in log messages."""
+        if not self._snippets:
+            return True
+        return _run_script(self.script(close), self.timeout, label, self.logger, self.files)
+
+
+def _run_script(script: str, timeout: int, label: str, logger: logging.Logger, files: Iterable[str] = ()) -> bool:
+    """Execute a session script and log the outcome; ``files`` (spilled payloads) are removed afterwards."""
+    try:
+        res = run_applescript(script, timeout=timeout + 10)
+    except subprocess.TimeoutExpired:
+        logger.error(f"Timeout updating {label}")
+        return False
+    except Exception as e:  # pragma: no cover - defensive
+        logger.error(f"Error invoking osascript for {label}: {e}")
+        return False
+    finally:
+        for path in files:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    stdout = (res.stdout or "").strip()
+    if stdout.startswith("ERROR:"):
+        logger.error(f"AppleScript error updating {label}: {stdout}")
+        return False
+    if res.returncode != 0:
+        logger.error(f"osascript non-zero exit updating {label}: rc={res.returncode} stderr={res.stderr.strip()}")
+        return False
+
+    logger.debug(f"Updated {label}")
+    return True
+
+
+def _sheet_names(numbers_abs: str, timeout: int = 30):
+    """Return the set of sheet names in the document, or ``None`` if the probe fails.
+
+    A read-only query: unlike the ensure script it never saves the document.
+    """
+    script = f'''
+tell application "Numbers"
+    try
+        {document_ref(numbers_abs)}
+        set {{otid, AppleScript's text item delimiters}} to {{AppleScript's text item delimiters, linefeed}}
+        set names to (name of every sheet of doc) as text
+        set AppleScript's text item delimiters to otid
+        return names
+    on error errorMessage
+        return "ERROR: " & errorMessage
+    end try
+end tell
+'''
+    try:
+        res = run_applescript(script, timeout=timeout)
+    except Exception:
+        return None
+    stdout = (res.stdout or "").strip("\n")
+    if res.returncode != 0 or stdout.startswith("ERROR:"):
+        return None
+    return set(stdout.split("\n"))
 
 
 def create_sheets(
@@ -19,8 +478,8 @@ def create_sheets(
     sheets: Iterable[Tuple[str, List[Any]]],
     force: bool = False,
     timeout: int = 30,
-) -> None:
-    """Create multiple sheets in a single Numbers open/save cycle.
+) -> bool:
+    """Create multiple sheets in a single Numbers open/save cycle; True if they all exist after.
 
     Parameters
     ----------
@@ -43,77 +502,23 @@ def create_sheets(
     """
     sheets = list(sheets)
     if not sheets:
-        return
+        return True
 
     numbers_abs = os.path.abspath(filename)
 
-    snippet_list: List[str] = []
-    for sheet_name, headers in sheets:
-        safe_sheet = str(sheet_name).replace('"', '\\"')
-        header_cmds = []
-        for i, header in enumerate(headers, 1):
-            escaped_header = str(header).replace('"', '\\"')
-            header_cmds.append(f'set value of cell {i} of row 1 to "{escaped_header}"')
-        headers_script = '\n                        '.join(header_cmds)
-
-        # AppleScript snippet per sheet
-        # targetSheet variable is reused per iteration safely (scoped inside tell doc)
-        snippet = f'''
-            -- Ensure sheet "{safe_sheet}"
-            set sheetExists to false
-            set targetSheet to missing value
-            repeat with s in sheets
-                if name of s is "{safe_sheet}" then
-                    set sheetExists to true
-                    set targetSheet to s
-                    exit repeat
-                end if
-            end repeat
-            if targetSheet is missing value then
-                set targetSheet to make new sheet
-                set name of targetSheet to "{safe_sheet}"
-            end if
-            tell targetSheet
-                -- Ensure predictable table name
-                set name of table 1 to "{safe_sheet}"
-                tell table 1
-                    if {str(force).lower()} or (not sheetExists) then
-                        set column count to {len(headers)}
-                        {headers_script}
-                    end if
-                end tell
-            end tell
-        '''
-        snippet_list.append(snippet)
+    if not force:
+        existing = _sheet_names(numbers_abs, timeout)
+        if existing is not None and all(name in existing for name, _ in sheets):
+            logger.debug(f"All sheets already present, skipping ensure: {[name for name, _ in sheets]}")
+            return True
 
+    snippet_list = [_ensure_sheet_snippet(name, headers, force) for name, headers in sheets]
     all_snippets = '\n'.join(snippet_list)
 
     script = f'''
 tell application "Numbers"
     try
-        set targetPath to "{numbers_abs}"
-        set doc to missing value
-        -- Iterate open documents; some may be unsaved (file is missing value)
-        repeat with d in documents
-            set matched to false
-            try
-                set f to file of d
-                if f is not missing value then
-                    set p to POSIX path of (f as alias)
-                    if p is targetPath then
-                        set matched to true
-                    end if
-                end if
-            end try
-            if matched then
-                set doc to d
-                exit repeat
-            end if
-        end repeat
-        if doc is missing value then
-            -- Open (returns existing if already open with same file, otherwise opens)
-            set doc to open (POSIX file targetPath)
-        end if
+        {document_ref(numbers_abs)}
 
         tell doc
 {all_snippets}
@@ -127,13 +532,13 @@ end tell
 '''
 
     try:
-        res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=timeout)
+        res = run_applescript(script, timeout=timeout)
     except subprocess.TimeoutExpired:
         logger.error("Timeout creating sheets in bulk")
-        return
+        return False
     except Exception as e:  # pragma: no cover
         logger.error(f"Unexpected error creating sheets: {e}")
-        return
+        return False
 
     stdout = (res.stdout or "").strip()
     if stdout.startswith("ERROR:"):
@@ -142,123 +547,93 @@ end tell
         logger.error(f"Bulk sheet creation non-zero exit: {res.stderr}")
     else:
         logger.debug(f"Bulk sheet creation/ensure completed for {[name for name, _ in sheets]}")
+        return True
+    return False
 
 
-def _write_sheet_chunk(
+def _chunks_script(
     sheet_name: str,
-    data_rows,
-    start_row: int,
+    chunks: List[Tuple[int, List[List[Any]]]],
     numbers_abs: str,
-    logger: logging.Logger,
-    timeout: int = 20,
-) -> bool:
-    """Internal helper to write a contiguous chunk of ``data_rows`` starting at ``start_row``.
-
-    Improvements vs earlier version:
-    - Returns bool success indicator instead of always None.
-    - Expands table column count if incoming data has more columns than existing.
-    - Escapes sheet name defensively.
-    - Adds explicit "OK" / "ERROR" return strings from AppleScript for clearer diagnostics.
-    - Parameterised timeout.
-    - Slightly clearer separation of Python-side row serialization.
-    """
-    # Fast-path: nothing to write
-    if not data_rows:
-        return True
-
-    # Calculate max column count we will need for this chunk
-    try:
-        max_cols = max(len(r) for r in data_rows if r is not None)
-    except ValueError:  # all rows None/empty
-        return True
-
-    safe_sheet = sheet_name.replace('"', '\\"')
+    timeout_per_chunk: int = 20,
+    close: bool = True,
+    save: bool = True,
+    max_cols: int = 0,
+):
+    """Build the single-run AppleScript writing every ``(start_row, data_rows)`` chunk.
 
-    # Encode rows for AppleScript list-of-lists syntax. Truncate each cell to 100 chars as before.
-    script_rows: list[str] = []
-    for row in data_rows:
-        if row is None:
-            row = []
-        row_str: list[str] = []
-        for cell in row:
-            if cell is None or cell == "":
-                row_str.append('""')
-            else:
-                cell_str = str(cell)[:100]
-                # Basic escaping for quotes + normalise newlines -> space (AppleScript doesn't like raw newlines inside string literal)
-                escaped = cell_str.replace('"', '\\"').replace('\n', ' ').replace('\r', ' ')
-                row_str.append(f'"{escaped}"')
-        script_rows.append('{' + ', '.join(row_str) + '}')
-
-    rows_applescript = '{' + ', '.join(script_rows) + '}'
-
-    # AppleScript: ensure sheet/table, expand columns if required, then write cell values row-by-row.
-    script = f'''
-tell application "Numbers"
-    try
-        set doc to open (POSIX file "{numbers_abs}")
-        tell doc
-            tell sheet "{safe_sheet}"
-                tell table 1
-                    if (column count) < {max_cols} then
-                        set column count to {max_cols}
-                    end if
-                    set dataRows to {rows_applescript}
-                    set rowIndex to {start_row}
-                    repeat with rowData in dataRows
-                        if rowIndex > (row count) then
-                            add row below last row
-                        end if
-                        set colIndex to 1
-                        repeat with cellValue in rowData
-                            try
-                                if column count >= colIndex then
-                                    set value of cell colIndex of row rowIndex to cellValue
-                                end if
-                            end try
-                            set colIndex to colIndex + 1
-                        end repeat
-                        set rowIndex to rowIndex + 1
-                    end repeat
-                end tell
-            end tell
-        end tell
-        save doc
-        close doc
-        return "OK"
-    on error errorMessage
-        return "ERROR: " & errorMessage
-    end try
-end tell
-'''
+    Returns ``(script, timeout, label, files)`` or ``None`` when there is nothing to write. Kept
+    separate from execution so callers can prepare the next script while one is running.
+    """
+    session = _NumbersSession(numbers_abs, logging.getLogger(__name__))
+    first_row = last_row = None
+    for start_row, data_rows in chunks:
+        if not session.write_chunk(sheet_name, data_rows, start_row, max_cols):
+            continue
+        first_row = start_row if first_row is None else first_row
+        last_row = start_row + len(data_rows) - 1
 
-    try:
-        res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=timeout)
-    except subprocess.TimeoutExpired:
-        logger.error(f"Timeout updating {sheet_name} chunk (rows {start_row}-{start_row + len(data_rows) - 1})")
-        return False
-    except Exception as e:  # pragma: no cover - defensive
-        logger.error(f"Error invoking osascript for {sheet_name} chunk: {e}")
-        return False
+    # Fast-path: nothing to write
+    if not session:
+        return None
 
-    stdout = (res.stdout or "").strip()
-    if stdout.startswith("ERROR:"):
-        logger.error(f"AppleScript error updating {sheet_name} chunk: {stdout}")
-        return False
-    if res.returncode != 0:
-        logger.error(f"osascript non-zero exit updating {sheet_name} chunk: rc={res.returncode} stderr={res.stderr.strip()}")
-        return False
+    session.timeout = timeout_per_chunk * len(session)
+    label = f"{sheet_name} (rows {first_row}-{last_row}, {len(session)} chunk(s))"
+    return session.script(close, save), session.timeout, label, session.files
 
-    logger.debug(
-        f"Updated {sheet_name} chunk (rows {start_row}-{start_row + len(data_rows) - 1}, cols 1-{max_cols})"
-    )
-    return True
 
+def _run_pipelined(jobs: List[tuple], logger: logging.Logger, depth: int = 2) -> List[bool]:
+    """Run ``_chunks_script(*job)`` scripts in order, building up to ``depth`` ahead of execution.
 
-def update_sheet(filename: str, logger: logging.Logger, sheet: str, rows: List[List[Any]]) -> None:
+    Numbers executes one script at a time, so runs stay strictly sequential; a single
+    background thread prepares (serialises/escapes) the next script while the current one
+    is in osascript, hiding the Python-side cost behind the AppleScript wait.
+    """
+    results: List[bool] = []
+    pending: deque = deque()
+    job_iter = iter(jobs)
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        for job in islice(job_iter, depth):
+            pending.append(pool.submit(_chunks_script, *job))
+        try:
+            while pending:
+                built = pending.popleft().result()
+                job = next(job_iter, None)
+                if job is not None:
+                    pending.append(pool.submit(_chunks_script, *job))
+                results.append(True if built is None else _run_script(*built[:3], logger, built[3]))
+        finally:
+            # A failed build aborts the loop; drop the spill files of builds that never ran
+            for future in pending:
+                if future.cancel() or future.exception() is not None or future.result() is None:
+                    continue
+                for path in future.result()[3]:
+                    try:
+                        os.remove(path)
+                    except OSError:
+                        pass
+    return results
+
+
+def _row_chunks(rows: List[List[Any]], chunk_size: int = 100) -> List[Tuple[int, List[List[Any]]]]:
+    """Split ``rows`` into ``(start_row, rows)`` chunks; data starts at row 2 (below headers)."""
+    return [(i + 2, rows[i:i + chunk_size]) for i in range(0, len(rows), chunk_size)]  # +2: headers + 1-indexed
+
+
+def update_sheet(
+    filename: str,
+    logger: logging.Logger,
+    sheet: str,
+    rows: List[List[Any]],
+    num_cols: Optional[int] = None,
+) -> None:
     """Update the given sheet with the provided rows (after headers).
 
-    Handles chunking to avoid overly large AppleScript payloads.
+    Rows are split into 100-row chunks to keep each packed payload small, but every chunk
+    goes into one osascript run with a single save and close, since each launch costs more
+    than the writes of a typical sheet.
+    ``num_cols`` is the sheet's column count when the caller knows it (e.g. from headers);
+    otherwise it is computed once across all rows rather than per chunk.
     Row 1 is assumed to contain headers already; data starts at row 2.
     """
     if not rows:
@@ -267,15 +642,60 @@ def update_sheet(filename: str, logger: logging.Logger, sheet: str, rows: List[L
     numbers_abs = os.path.abspath(filename)
     chunk_size = 100
     total_rows = len(rows)
-
     if total_rows > chunk_size:
-        logger.debug(f"Processing {total_rows} rows in chunks of {chunk_size}")
-        for i in range(0, total_rows, chunk_size):
-            chunk = rows[i:i + chunk_size]
-            chunk_start = i + 2  # +2: headers + 1-indexed
-            _write_sheet_chunk(sheet, chunk, chunk_start, numbers_abs, logger)
-    else:
-        _write_sheet_chunk(sheet, rows, 2, numbers_abs, logger)
+        logger.debug(f"Processing {total_rows} rows in chunks of {chunk_size} (single run)")
+    built = _chunks_script(sheet, _row_chunks(rows, chunk_size), numbers_abs, 20, True, True, num_cols or _max_cols(rows))
+    if built is not None:
+        _run_script(*built[:3], logger, built[3])
+
+
+def update_sheets(filename: str, logger: logging.Logger, sheet_rows: Dict[str, List[List[Any]]]) -> Dict[str, bool]:
+    """Update several sheets, building the next sheet's script while the current one runs.
+
+    Each sheet is written by its own osascript run (see ``_run_pipelined``); the document is
+    saved and closed only after the last sheet. Returns ``{sheet: success}``.
+    """
+    items = [(sheet, rows) for sheet, rows in sheet_rows.items() if rows]
+    if not items:
+        return {}
+
+    numbers_abs = os.path.abspath(filename)
+    last = len(items) - 1
+    results = _run_pipelined(
+        [
+            (sheet, _row_chunks(rows), numbers_abs, 20, i == last, i == last, _max_cols(rows))
+            for i, (sheet, rows) in enumerate(items)
+        ],
+        logger,
+    )
+    return {sheet: ok for (sheet, _), ok in zip(items, results)}
+
+
+def ensure_and_update(
+    filename: str,
+    logger: logging.Logger,
+    sheet: str,
+    headers: List[Any],
+    rows: List[List[Any]],
+    per_row: list = None,
+    timeout: int = 120,
+) -> bool:
+    """Ensure ``sheet`` exists, write ``rows`` from row 2 and apply ``per_row`` formulas in one script.
+
+    Equivalent to ``create_sheets`` + ``update_sheet`` (+ ``apply_formulas``) but with a single
+    osascript invocation and a single save, since the setup/teardown of each Apple Event session
+    dominates the cost of these small sheets.
+    """
+    if not rows:
+        return True
+
+    max_cols = max(len(headers), _max_cols(rows))
+    session = _NumbersSession(filename, logger, timeout=timeout)
+    session.ensure_sheets([(sheet, headers)])
+    session.write_chunk(sheet, rows, 2, max_cols)
+    if per_row:
+        session.apply_formulas(sheet, per_row, 2)
+    return session.run(f"{sheet} ({len(rows)} rows, formulas={bool(per_row)})")
 
 
 def apply_formulas(
@@ -288,6 +708,8 @@ def apply_formulas(
     static: list = None,
     table_index: int = 1,
     timeout_sec: int = 300,
+    save_on_exit: bool = True,
+    close_on_exit: bool = True,
 ):
     """
     Generic AppleScript-based formula applier.
@@ -297,9 +719,12 @@ def apply_formulas(
     static: list of (cell_ref, formula_string) for one-off formulas (e.g., [("A1", "=1+1")])
     If end_row is None it uses current table row count.
     All formulas must include the leading "=".
+    save_on_exit / close_on_exit: pass False for all but the last of several consecutive calls
+    so the document package is rewritten once rather than after every sheet.
+    Returns True once the formulas are applied (or there were none), False on failure.
     """
     if not per_row and not static:
-        return
+        return True
 
     numbers_abs = os.path.abspath(filename)
 
@@ -309,36 +734,23 @@ def apply_formulas(
         for cell_ref, formula in static:
             if not formula.startswith("="):
                 formula = "=" + formula
-            esc = formula.replace('"', '\\"')
+            esc = formula.translate(_AS_ESCAPE)
             static_cmds.append(f'set value of cell "{cell_ref}" to "{esc}"')
 
-    per_row_cmds = []
-    if per_row:
-        for col, formula in per_row:
-            if not formula.startswith("="):
-                formula = "=" + formula
-            # We'll substitute {row} at runtime inside AppleScript
-            esc = formula.replace('"', '\\"')
-            per_row_cmds.append(f'''
-                        set fml to "{esc}"
-                        set fml to my replace_text(fml, "{{row}}", r as text)
-                        set value of cell ("{col}" & r) to fml''')
-
     per_row_block = ""
-    if per_row_cmds:
-        per_row_block = f'''
-                        repeat with r from {start_row} to rowLimit
-{''.join(per_row_cmds)}
-                        end repeat'''
+    if per_row:
+        per_row_block = _per_row_formulas_snippet(per_row, start_row)
 
     static_block = ""
     if static_cmds:
         static_block = "\n                        " + "\n                        ".join(static_cmds)
 
+    exit_cmds = ("\n            save doc" if save_on_exit else "") + ("\n            close doc" if close_on_exit else "")
+
     script = f'''tell application "Numbers"
     with timeout of {timeout_sec} seconds
         try
-            set doc to open (POSIX file "{numbers_abs}")
+            {document_ref(numbers_abs)}
             tell doc
                 if (every sheet whose name is "{sheet}") = {{}} then return "ERROR: Missing sheet {sheet}"
                 tell sheet "{sheet}"
@@ -350,28 +762,17 @@ def apply_formulas(
                         end if{static_block}{per_row_block}
                     end tell
                 end tell
-            end tell
-            save doc
-            close doc
+            end tell{exit_cmds}
             return "OK"
         on error errMsg
             return "ERROR: " & errMsg
         end try
     end timeout
 end tell
-
-on replace_text(t, find, repl)
-    set {{otid, AppleScript's text item delimiters}} to {{AppleScript's text item delimiters, find}}
-    set parts to text items of t
-    set AppleScript's text item delimiters to repl
-    set newText to parts as text
-    set AppleScript's text item delimiters to otid
-    return newText
-end replace_text
 '''
 
     try:
-        res = subprocess.run(["osascript", "-e", script], capture_output=True, text=True, timeout=timeout_sec + 30)
+        res = run_applescript(script, timeout=timeout_sec + 30)
         out = (res.stdout or "").strip()
         if out.startswith("ERROR:"):
             logger.error(f"apply_formulas AppleScript error ({sheet}): {out}")
@@ -379,10 +780,12 @@ end replace_text
             logger.error(f"apply_formulas non-zero exit ({sheet}) rc={res.returncode} stderr={res.stderr.strip()}")
         else:
             logger.debug(f"Formulas applied to {sheet} (per_row={bool(per_row)} static={bool(static)})")
+            return True
     except subprocess.TimeoutExpired:
         logger.error(f"apply_formulas timeout on sheet {sheet}")
     except Exception as e:  # pragma: no cover
         logger.error(f"apply_formulas unexpected error on {sheet}: {e}")
+    return False
 
 
-__all__ = ["create_sheets", "update_sheet", "append_rows", "apply_formulas"]
+__all__ = ["run_applescript", "document_ref", "create_sheets", "update_sheet", "update_sheets", "ensure_and_update", "append_rows", "apply_formulas"]
@@ -1,7 +1,10 @@
 #!/usr/bin/env python3
 
 import os
+import json
+import hashlib
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Tuple, Optional
 from dotenv import load_dotenv
 
@@ -11,10 +14,16 @@ import platform
 # Determine platform once (avoid repeated expensive calls & branching noise)
 IS_MACOS = platform.system() == 'Darwin'
 
-if IS_MACOS:
+
+def _get_exporter_cls():
+    """Import the platform exporter on first use, so early config/auth exits skip the import."""
+    if IS_MACOS:
         from macos.numbers_export import MacOSDraftExporter as DraftExporter  # type: ignore
-else:
+    else:
         from windows.xlsx_export import XlsxDraftExporter as DraftExporter  # type: ignore
+    return DraftExporter
+
+
 """Setup script: builds canonical XLSX; on macOS a .numbers companion is auto-created by exporter.
 
 Refactored for clarity & maintainability:
@@ -33,10 +42,9 @@ logging.basicConfig(
     format='%(levelname)s: %(message)s'
 )
 
-def setup_yahoo_authentication() -> bool:
+def setup_yahoo_authentication(api: YahooFantasyAPI) -> bool:
     """Ensure Yahoo OAuth is configured (load/refresh or interactive authenticate)."""
     print("\n=== Yahoo API Authentication ===")
-    api = YahooFantasyAPI()
     try:
         if api.load_token() and api.refresh_token_if_needed():
             print("✓ Yahoo authentication already configured")
@@ -68,25 +76,30 @@ def derive_filenames(requested: str) -> Tuple[str, str]:
     return xlsx, numbers
 
 
-def resolve_existing_target_name(requested: str) -> str:
-    """Determine which file we consider the primary artifact for overwrite check."""
-    if IS_MACOS:
-        if requested.lower().endswith('.numbers'):
-            return requested
-        if requested.lower().endswith('.xlsx'):
-            return requested[:-5] + '.numbers'
-        return requested + '.numbers'
-    # Windows / non-mac: ensure .xlsx
-    if requested.lower().endswith('.xlsx'):
-        return requested
-    return requested + '.xlsx'
-
-
-def prompt_overwrite(path: str) -> bool:
-    """Prompt before overwriting existing file unless FORCE_OVERWRITE=1 is set."""
-    if not os.path.exists(path):
+def resolve_existing_target_name(filenames: Tuple[str, str]) -> str:
+    """Determine which file we consider the primary artifact for overwrite check.
+
+    ``filenames`` is the ``(xlsx, numbers)`` pair from ``derive_filenames``, so the overwrite
+    check and the export always agree on the target.
+    """
+    xlsx, numbers = filenames
+    return numbers if IS_MACOS else xlsx
+
+
+def prompt_overwrite(path: str, exists: Optional[bool] = None, force: Optional[bool] = None) -> bool:
+    """Prompt before overwriting existing file unless FORCE_OVERWRITE=1 is set.
+
+    ``exists`` may be passed by a caller that already checked the path. ``lexists`` is used so a
+    .numbers bundle (a directory) or a dangling symlink costs one non-following stat.
+    ``force`` defaults to the FORCE_OVERWRITE environment variable.
+    """
+    if exists is None:
+        exists = os.path.lexists(path)
+    if not exists:
         return True
-    if os.getenv('FORCE_OVERWRITE') == '1':
+    if force is None:
+        force = os.getenv('FORCE_OVERWRITE') == '1'
+    if force:
         print(f"⚠ Overwriting existing file '{path}' (FORCE_OVERWRITE=1)")
         return True
     response = input(f"\n⚠ File '{path}' already exists. Overwrite it? (y/n): ").lower().strip()
@@ -95,27 +108,78 @@ def prompt_overwrite(path: str) -> bool:
     print("\n✓ Setup cancelled. Your existing file was not modified.")
     return False
 
-def initialize_data() -> bool:
+def _settings_digest(league_settings: dict) -> str:
+    """Stable hash of league settings, used to skip rebuilding projection sheets on re-runs."""
+    return hashlib.sha1(json.dumps(league_settings, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _projection_sheet_names(league_settings: dict) -> list:
+    """Names of the projection sheets ``setup_projection_sheets`` builds for these settings."""
+    types = {stat.get('position_type') for stat in league_settings.get('stat_categories', [])
+             if stat.get('display_name') or stat.get('name')}
+    return [name for ptype, name in (('P', "Skater Projections"), ('G', "Goalie Projections")) if ptype in types]
+
+
+def _read_meta(path: str) -> dict:
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _write_meta(path: str, meta: dict) -> None:
+    try:
+        with open(path, 'w') as f:
+            json.dump(meta, f)
+    except OSError as e:  # pragma: no cover - non-fatal
+        logging.debug(f"Could not write {path}: {e}")
+
+
+def initialize_data(api: Optional[YahooFantasyAPI] = None, filenames: Optional[Tuple[str, str]] = None,
+                    target_existed: Optional[bool] = None) -> bool:
     """Initialize workbook with league + draft data.
 
     Unified order (all platforms): draft analysis -> league settings -> teams -> projections -> draft board -> timestamp.
+    ``target_existed`` is the caller's ``lexists`` check of the target, if it already made one.
     """
     try:
-        api = YahooFantasyAPI()
-        requested_filename = os.getenv('FILENAME', 'fantasy_draft_data.xlsx')
-        xlsx_filename, numbers_filename = derive_filenames(requested_filename)
+        api = api or YahooFantasyAPI()
+        xlsx_filename, numbers_filename = filenames or derive_filenames(os.getenv('FILENAME', 'fantasy_draft_data.xlsx'))
 
-        exporter = DraftExporter(xlsx_filename)
+        target_filename = numbers_filename if IS_MACOS else xlsx_filename
+        if target_existed is None:
+            target_existed = os.path.lexists(target_filename)  # before the exporter creates it
+        exporter = _get_exporter_cls()(xlsx_filename)
         print(f"Creating {'Numbers' if IS_MACOS else 'Excel'} file: {numbers_filename if IS_MACOS else xlsx_filename}")
 
-        api.ensure_authenticated()
+        if not api.session:
+            api.ensure_authenticated()
+        if not api.year_id:
+            api.get_game_key()  # resolve once so the concurrent fetches don't each look it up
 
         league_settings: Optional[dict] = None
+        draft_analysis = None
+
+        # Settings, teams and draft results come back from ONE combined league request; the
+        # paged draft analysis is fetched alongside it. The exporter is then fed in order below.
+        bundle_keys = {
+            'update_league_settings_data': 'league_settings',
+            'update_teams_data': 'teams',
+            'update_draft_results_data': 'draft_results',
+        }
+        wanted = [key for name, key in bundle_keys.items() if hasattr(exporter, name)]
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            analysis_future = None
+            if hasattr(exporter, 'create_draft_board'):
+                print("Fetching draft analysis data...")
+                analysis_future = pool.submit(api.get_player_draft_analysis)
+            print("Fetching league settings, teams and draft results...")
+            bundle = api.get_bundle(wanted) if wanted else {}
+            draft_analysis = analysis_future.result() if analysis_future else None
 
         # Draft Board
         if hasattr(exporter, 'create_draft_board'):
-            print("Fetching draft analysis data...")
-            draft_analysis = api.get_player_draft_analysis()
             if draft_analysis:
                 exporter.create_draft_board(draft_analysis)  # type: ignore[attr-defined]
                 print(f"✓ Draft analysis: {len(draft_analysis)} players")
@@ -124,8 +188,7 @@ def initialize_data() -> bool:
 
         # League settings
         if hasattr(exporter, 'update_league_settings_data'):
-            print("Fetching league settings...")
-            league_settings = api.get_league_settings()
+            league_settings = bundle.get('league_settings')
             if league_settings:
                 exporter.update_league_settings_data(league_settings)  # type: ignore[attr-defined]
                 print(f"✓ League settings: {league_settings.get('league_name', 'Unknown League')}")
@@ -136,8 +199,7 @@ def initialize_data() -> bool:
 
         # Teams
         if hasattr(exporter, 'update_teams_data'):
-            print("Fetching teams data...")
-            teams = api.get_teams_data()
+            teams = bundle.get('teams')
             if teams:
                 exporter.update_teams_data(teams)  # type: ignore[attr-defined]
                 print(f"✓ Teams: {len(teams)}")
@@ -146,8 +208,7 @@ def initialize_data() -> bool:
 
         # Draft Results
         if hasattr(exporter, 'update_draft_results_data'):
-            print("Fetching draft results data...")
-            draft_results = api.get_draft_results()
+            draft_results = bundle.get('draft_results')
             if draft_results:
                 exporter.update_draft_results_data(draft_results)  # type: ignore[attr-defined]
                 print(f"✓ Draft results: {len(draft_results)} picks")
@@ -156,12 +217,28 @@ def initialize_data() -> bool:
 
         # Projections after base data (only if we have league settings)
         if league_settings and hasattr(exporter, 'setup_projection_sheets'):
-            try:
-                print("Building projection sheets...")
-                exporter.setup_projection_sheets(league_settings)  # type: ignore[attr-defined]
-                print("✓ Projection sheets ready")
-            except Exception:  # pragma: no cover - defensive
-                print("⚠ Failed to build projection sheets")
+            meta_path = target_filename + '.meta.json'
+            digest = _settings_digest(league_settings)
+            # On macOS the Draft Board CSV import above replaced the whole document, so
+            # whatever projection sheets it had are gone regardless of the stored digest
+            document_rebuilt = IS_MACOS and bool(draft_analysis)
+            if (target_existed and not document_rebuilt
+                    and _read_meta(meta_path).get('league_settings_sha1') == digest
+                    and exporter.has_sheets(_projection_sheet_names(league_settings))):  # type: ignore[attr-defined]
+                print("✓ Projection sheets unchanged (league settings identical)")
+            else:
+                built = False
+                try:
+                    print("Building projection sheets...")
+                    built = exporter.setup_projection_sheets(league_settings)  # type: ignore[attr-defined]
+                except Exception:  # pragma: no cover - defensive
+                    pass
+                if built:
+                    # Recorded only after a complete build, so a failed one is retried next run
+                    _write_meta(meta_path, {'league_settings_sha1': digest})
+                    print("✓ Projection sheets ready")
+                else:
+                    print("⚠ Failed to build projection sheets")
 
         if draft_analysis and hasattr(exporter, 'create_pos_sheets'):
             print("Building position sheets...")
@@ -190,23 +267,29 @@ def main() -> None:
         print("Please copy .env.example to .env and fill in your values")
         return
 
-    required_vars = ['YAHOO_CLIENT_ID', 'YAHOO_CLIENT_SECRET', 'LEAGUE_ID']
-    missing = [v for v in required_vars if not os.getenv(v)]
+    # Read the settings used below once and pass them down; the os.getenv fallbacks in
+    # prompt_overwrite / initialize_data only run when those are called on their own
+    env = {k: os.getenv(k) for k in ('YAHOO_CLIENT_ID', 'YAHOO_CLIENT_SECRET', 'LEAGUE_ID', 'FILENAME', 'FORCE_OVERWRITE')}
+    missing = [v for v in ('YAHOO_CLIENT_ID', 'YAHOO_CLIENT_SECRET', 'LEAGUE_ID') if not env.get(v)]
     if missing:
         print(f"✗ Missing required environment variables: {', '.join(missing)}")
         print("Please check your .env file")
         return
 
-    if not setup_yahoo_authentication():
+    # One API instance: the token loaded/refreshed during authentication is reused for the data fetches
+    api = YahooFantasyAPI()
+    if not setup_yahoo_authentication(api):
         return
 
-    requested_filename = os.getenv('FILENAME', 'fantasy_draft_data.xlsx')
-    target = resolve_existing_target_name(requested_filename)
-    if not prompt_overwrite(target):
+    filenames = derive_filenames(env['FILENAME'] or 'fantasy_draft_data.xlsx')
+    target = resolve_existing_target_name(filenames)
+    # One stat of the target, shared by the overwrite prompt and the projection-skip check
+    target_existed = os.path.lexists(target)
+    if not prompt_overwrite(target, exists=target_existed, force=env.get('FORCE_OVERWRITE') == '1'):
         return
 
     print("\n=== Initializing Draft Workbook ===")
-    success = initialize_data()
+    success = initialize_data(api, filenames, target_existed=target_existed)
     if success:
         print("\n✓ Setup completed successfully!")
         print("\nNext steps:")
@@ -2,29 +2,41 @@ import os
 import logging
 from openpyxl import Workbook, load_workbook
 from datetime import datetime
+from types import MappingProxyType
 from typing import List, Dict, Any
 
+try:
+    from openpyxl.styles import Font, PatternFill
+    # Shared style objects, created once instead of per header cell
+    _HEADER_FONT = Font(bold=True)
+    _HEADER_FILL = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
+except Exception:  # pragma: no cover - styling is optional
+    _HEADER_FONT = _HEADER_FILL = None
+
 
 class XlsxDraftExporter:
     """Windows exporter for Excel files."""
 
-    BASE_SHEETS = {
-        "Draft Board": ["draftedBy", "playerName", "team", "position", "averagePick", "projectedPoints"],
-        "League Settings": ["setting", "value"],
-        "Teams": ["teamKey", "teamId", "teamName", "manager"],
-        "Draft Results": ["round", "pick", "playerName", "teamId", "manager"],
-        "Pre-Draft Analysis": [
+    # Read-only class-level table shared by all instances; header rows are tuples
+    BASE_SHEETS = MappingProxyType({
+        "Draft Board": ("draftedBy", "playerName", "team", "position", "averagePick", "projectedPoints"),
+        "League Settings": ("setting", "value"),
+        "Teams": ("teamKey", "teamId", "teamName", "manager"),
+        "Draft Results": ("round", "pick", "playerName", "teamId", "manager"),
+        "Pre-Draft Analysis": (
             "playerKey", "playerName", "team", "position", "averagePick", "averageRound", "percentDrafted",
             "projectedAuctionValue", "averageAuctionCost", "seasonRank", "positionRank", "preseasonAveragePick",
             "preseasonPercentDrafted"
-        ]
-    }
+        ),
+    })
 
     def __init__(self, filename: str = "fantasy_draft_data.xlsx"):
         if not filename.lower().endswith('.xlsx'):
             filename += '.xlsx'
         self.filename = filename
         self.logger = logging.getLogger(__name__)
+        self._wb = None
+        self._mtime = None  # st_mtime_ns of the file when last loaded or saved
         if not os.path.exists(self.filename):
             self._create_full_base()
         else:
@@ -38,12 +50,13 @@ class XlsxDraftExporter:
         for sheet, headers in self.BASE_SHEETS.items():
             ws = wb.create_sheet(sheet)
             self._style_headers(ws, headers)
-        wb.save(self.filename)
+        self._wb = wb
+        self._save()
         self.logger.debug(f"Created new workbook {self.filename} with base sheets")
 
     def _verify_sheets(self):
         """Ensure all required sheets exist in the workbook."""
-        wb = load_workbook(self.filename)
+        wb = self._workbook()
         changed = False
         for sheet, headers in self.BASE_SHEETS.items():
             if sheet not in wb.sheetnames:
@@ -51,34 +64,61 @@ class XlsxDraftExporter:
                 self._style_headers(ws, headers)
                 changed = True
         if changed:
-            wb.save(self.filename)
+            self._save()
+
+    def _file_mtime(self):
+        try:
+            return os.stat(self.filename).st_mtime_ns
+        except OSError:
+            return None
+
+    def _workbook(self):
+        """Return the workbook, re-loading it only if the file changed since the last load or save.
+
+        The user may save their own edits from Excel while the exporter runs; those are picked
+        up instead of being overwritten by a stale copy, and otherwise each update skips
+        re-parsing the whole xlsx.
+        """
+        mtime = self._file_mtime()
+        if self._wb is None or mtime != self._mtime:
+            self._wb = load_workbook(self.filename)
+            self._mtime = mtime
+        return self._wb
+
+    def _save(self):
+        """Write the in-memory workbook to disk."""
+        self._wb.save(self.filename)
+        self._mtime = self._file_mtime()
+
+    @staticmethod
+    def _clear_data_rows(ws):
+        """Drop every row below the header.
+
+        Deleting the rows (rather than blanking each cell) frees the cell objects, keeps
+        them out of the saved XML and resets max_row so ``ws.append`` starts at row 2.
+        """
+        if ws.max_row > 1:
+            ws.delete_rows(2, ws.max_row - 1)
 
     def _style_headers(self, ws, headers):
         """Apply styling to header row."""
-        try:
-            from openpyxl.styles import Font, PatternFill
-        except Exception:
-            Font = None
         for col, h in enumerate(headers, 1):
             cell = ws.cell(row=1, column=col, value=h)
-            if 'Font' in globals() and Font:
-                cell.font = Font(bold=True)
-                try:
-                    cell.fill = PatternFill(start_color="DDDDDD", end_color="DDDDDD", fill_type="solid")
-                except Exception:
-                    pass
+            if _HEADER_FONT is not None:
+                cell.font = _HEADER_FONT
+                cell.fill = _HEADER_FILL
 
     def append_picks(self, rows: List[List[str]]):
         """Append new draft picks to Draft Results sheet."""
         if not rows:
             return
-        wb = load_workbook(self.filename)
+        wb = self._workbook()
         ws = wb["Draft Results"]
         start = ws.max_row + 1
         for r_index, row in enumerate(rows, start=start):
             for c_index, val in enumerate(row, start=1):
                 ws.cell(row=r_index, column=c_index, value=val)
-        wb.save(self.filename)
+        self._save()
         self.logger.debug(f"Added {len(rows)} picks (rows {start}-{start+len(rows)-1})")
 
     # ---- Compatibility adapters (used by windows.draft_monitor) ----
@@ -92,52 +132,53 @@ class XlsxDraftExporter:
 
     def timestamp(self):
         """Add timestamp to Draft Results sheet."""
-        wb = load_workbook(self.filename)
+        wb = self._workbook()
         ws = wb["Draft Results"]
         ws['I1'] = f"Last updated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
-        wb.save(self.filename)
+        self._save()
 
     def update_league_settings_data(self, league_settings: Dict[str, Any]):
         """Populate League Settings sheet with grouped sections."""
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             if "League Settings" not in wb.sheetnames:
                 return
             ws = wb["League Settings"]
             # Clear existing (keep headers row 1)
-            for row in list(ws.iter_rows(min_row=2)):
-                for cell in row:
-                    cell.value = None
-
-            rows = []
-            rows.append(["League Name", league_settings.get('league_name', '')])
-            rows.append(["League Type", league_settings.get('league_type', '')])
-            rows.append(["Scoring Type", league_settings.get('scoring_type', '')])
-            rows.append(["Max Teams", league_settings.get('max_teams', '')])
-            rows.append(["Playoff Teams", league_settings.get('num_playoff_teams', '')])
-            rows.append(["Playoff Start Week", league_settings.get('playoff_start_week', '')])
-            rows.append(["", ""])  # spacer
-            rows.append(["ROSTER POSITIONS", "COUNT"])
-            for pos in league_settings.get('roster_positions', []):
-                rows.append([pos.get('position', ''), pos.get('count', '')])
-            rows.append(["", ""])  # spacer
-            rows.append(["SKATER STATS", "VALUE"])
-            for stat in league_settings.get('stat_categories', []):
-                if stat.get('position_type') == 'P':
-                    name = stat.get('display_name') or stat.get('name') or ''
-                    rows.append([name, stat.get('value', '')])
-            rows.append(["", ""])  # spacer
-            rows.append(["GOALIE STATS", "VALUE"])
+            self._clear_data_rows(ws)
+
+            roster_positions = league_settings.get('roster_positions', [])
+            skater_stats, goalie_stats = [], []
             for stat in league_settings.get('stat_categories', []):
-                if stat.get('position_type') == 'G':
-                    name = stat.get('display_name') or stat.get('name') or ''
-                    rows.append([name, stat.get('value', '')])
+                ptype = stat.get('position_type')
+                if ptype == 'P':
+                    skater_stats.append([stat.get('display_name') or stat.get('name') or '', stat.get('value', '')])
+                elif ptype == 'G':
+                    goalie_stats.append([stat.get('display_name') or stat.get('name') or '', stat.get('value', '')])
+
+            rows = [
+                ["League Name", league_settings.get('league_name', '')],
+                ["League Type", league_settings.get('league_type', '')],
+                ["Scoring Type", league_settings.get('scoring_type', '')],
+                ["Max Teams", league_settings.get('max_teams', '')],
+                ["Playoff Teams", league_settings.get('num_playoff_teams', '')],
+                ["Playoff Start Week", league_settings.get('playoff_start_week', '')],
+                ["", ""],  # spacer
+                ["ROSTER POSITIONS", "COUNT"],
+                *([pos.get('position', ''), pos.get('count', '')] for pos in roster_positions),
+                ["", ""],  # spacer
+                ["SKATER STATS", "VALUE"],
+                *skater_stats,
+                ["", ""],  # spacer
+                ["GOALIE STATS", "VALUE"],
+                *goalie_stats,
+            ]
 
             # Write rows
             for i, row in enumerate(rows, start=2):
                 for j, val in enumerate(row, start=1):
                     ws.cell(row=i, column=j, value=val)
-            wb.save(self.filename)
+            self._save()
         except Exception as e:
             self.logger.debug(f"Failed to write league settings: {e}")
 
@@ -146,19 +187,17 @@ class XlsxDraftExporter:
         if not teams_rows:
             return
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             sheet = "Teams"
             if sheet in wb.sheetnames:
                 ws = wb[sheet]
-                for row in list(ws.iter_rows(min_row=2)):
-                    for cell in row:
-                        cell.value = None
+                self._clear_data_rows(ws)
             else:
                 ws = wb.create_sheet(title=sheet)
                 ws.append(["team_key", "team_id", "team_name", "manager"])
             for r in teams_rows:
                 ws.append(r)
-            wb.save(self.filename)
+            self._save()
         except Exception as e:
             self.logger.debug(f"Failed to write teams data: {e}")
 
@@ -167,7 +206,7 @@ class XlsxDraftExporter:
         if not players_rows:
             return
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             name = "Pre-Draft Analysis"
             if name not in wb.sheetnames:
                 ws = wb.create_sheet(title=name)
@@ -175,20 +214,22 @@ class XlsxDraftExporter:
             else:
                 ws = wb[name]
                 # Clear rows except header
-                for row in list(ws.iter_rows(min_row=2)):
-                    for cell in row:
-                        cell.value = None
+                self._clear_data_rows(ws)
             for r in players_rows:
                 if r:
                     ws.append(r)
-            wb.save(self.filename)
+            self._save()
         except Exception as e:
             self.logger.debug(f"Failed to write pre-draft analysis: {e}")
 
-    def setup_projection_sheets(self, league_settings):
-        """Create Skater/Goalie Projections sheets with TOTAL formulas."""
+    def has_sheets(self, names) -> bool:
+        """True if every sheet in ``names`` exists in the workbook."""
+        return set(names) <= set(self._workbook().sheetnames)
+
+    def setup_projection_sheets(self, league_settings) -> bool:
+        """Create Skater/Goalie Projections sheets with TOTAL formulas; True if all were written."""
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             # Determine stat names by position_type
             skater_stats, goalie_stats = [], []
             for stat in league_settings.get('stat_categories', []):
@@ -206,9 +247,7 @@ class XlsxDraftExporter:
                     self._style_headers(ws, ["playerName"] + skater_stats + ["TOTAL"])
                 else:
                     ws = wb["Skater Projections"]
-                    for row in list(ws.iter_rows(min_row=2)):
-                        for cell in row:
-                            cell.value = None
+                    self._clear_data_rows(ws)
 
             if goalie_stats:
                 if "Goalie Projections" not in wb.sheetnames:
@@ -216,25 +255,26 @@ class XlsxDraftExporter:
                     self._style_headers(wg, ["playerName"] + goalie_stats + ["TOTAL"])
                 else:
                     wg = wb["Goalie Projections"]
-                    for row in list(wg.iter_rows(min_row=2)):
-                        for cell in row:
-                            cell.value = None
+                    self._clear_data_rows(wg)
 
-            wb.save(self.filename)
+            self._save()
             # Add formula templates
+            ok = True
             if skater_stats:
-                self._setup_total_formulas("Skater Projections", skater_stats, league_settings)
-            if goalie_stats:
-                self._setup_total_formulas("Goalie Projections", goalie_stats, league_settings)
+                ok = self._setup_total_formulas("Skater Projections", skater_stats, league_settings)
+            if ok and goalie_stats:
+                ok = self._setup_total_formulas("Goalie Projections", goalie_stats, league_settings)
+            return ok
         except Exception as e:
             self.logger.debug(f"Failed to setup projection sheets: {e}")
+            return False
 
-    def _setup_total_formulas(self, sheet_name: str, stat_names, league_settings):
-        """Set up TOTAL column formulas for projection sheets."""
+    def _setup_total_formulas(self, sheet_name: str, stat_names, league_settings) -> bool:
+        """Set up TOTAL column formulas for projection sheets; False on failure."""
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             if sheet_name not in wb.sheetnames:
-                return
+                return False
             ws = wb[sheet_name]
             ptype = 'G' if 'Goalie' in sheet_name else 'P'
             values = {}
@@ -246,23 +286,27 @@ class XlsxDraftExporter:
                     except Exception:
                         values[name] = 0
             TOTAL_col = len(stat_names) + 2  # playerName + stats + TOTAL
-            for row_idx in range(2, 1502):
-                parts = []
-                for i, stat_name in enumerate(stat_names):
-                    val = values.get(stat_name, 0)
-                    if val:
-                        col_letter = chr(66 + i)  # B onward
-                        parts.append(f"{col_letter}{row_idx}*{val}")
-                if parts:
-                    ws.cell(row=row_idx, column=TOTAL_col, value="=" + "+".join(parts))
-            wb.save(self.filename)
+            # Row-invariant template built once: "=B{r}*4+C{r}*3" (B onward per stat)
+            parts = [
+                f"{chr(66 + i)}{{r}}*{values.get(stat_name, 0)}"
+                for i, stat_name in enumerate(stat_names)
+                if values.get(stat_name, 0)
+            ]
+            if parts:
+                template = "=" + "+".join(parts)
+                cell = ws.cell
+                for row_idx in range(2, 1502):
+                    cell(row=row_idx, column=TOTAL_col, value=template.format(r=row_idx))
+            self._save()
+            return True
         except Exception as e:
             self.logger.debug(f"Failed to set total formulas for {sheet_name}: {e}")
+            return False
 
     def create_draft_board(self):
         """Create Draft Board with formulas referencing other sheets."""
         try:
-            wb = load_workbook(self.filename)
+            wb = self._workbook()
             if "Pre-Draft Analysis" not in wb.sheetnames:
                 return
             analysis = wb["Pre-Draft Analysis"]
@@ -272,29 +316,29 @@ class XlsxDraftExporter:
             else:
                 db = wb["Draft Board"]
                 # Clear existing rows (keep header)
-                for row in list(db.iter_rows(min_row=2)):
-                    for cell in row:
-                        cell.value = None
-
-            max_row = analysis.max_row
-            # Populate with direct cell references
-            for r in range(2, max_row + 1):
-                if not analysis[f"A{r}"].value:
+                self._clear_data_rows(db)
+
+            # Column A values in one pass; cells addressed by (row, column) so openpyxl
+            # doesn't parse an "A12"-style coordinate string for every write
+            cell = db.cell
+            keys = analysis.iter_rows(min_row=2, max_col=1, values_only=True)
+            for r, (key,) in enumerate(keys, start=2):
+                if not key:
                     continue
                 # draftedBy via Draft Results lookup (using player_key from Pre-Draft Analysis column A)
-                db[f"A{r}"] = f"=IFERROR(VLOOKUP('Pre-Draft Analysis'!A{r},'Draft Results'!C:D,2,FALSE),\"\")"
+                cell(row=r, column=1, value=f"=IFERROR(VLOOKUP('Pre-Draft Analysis'!A{r},'Draft Results'!C:D,2,FALSE),\"\")")
                 # Direct references for playerName, team, position, averagePick
-                db[f"B{r}"] = f"='Pre-Draft Analysis'!B{r}"
-                db[f"C{r}"] = f"='Pre-Draft Analysis'!C{r}"
-                db[f"D{r}"] = f"='Pre-Draft Analysis'!D{r}"
-                db[f"E{r}"] = f"='Pre-Draft Analysis'!E{r}"
+                cell(row=r, column=2, value=f"='Pre-Draft Analysis'!B{r}")
+                cell(row=r, column=3, value=f"='Pre-Draft Analysis'!C{r}")
+                cell(row=r, column=4, value=f"='Pre-Draft Analysis'!D{r}")
+                cell(row=r, column=5, value=f"='Pre-Draft Analysis'!E{r}")
                 # projectedPoints: choose goalie vs skater projection VLOOKUP (using playerName)
-                db[f"F{r}"] = (
+                cell(row=r, column=6, value=(
                     f"=IF('Pre-Draft Analysis'!D{r}=\"G\"," \
                     f"IFERROR(VLOOKUP('Pre-Draft Analysis'!B{r},'Goalie Projections'!A:F,6,FALSE),\"\")," \
                     f"IFERROR(VLOOKUP('Pre-Draft Analysis'!B{r},'Skater Projections'!A:I,9,FALSE),\"\"))"
-                )
-            wb.save(self.filename)
+                ))
+            self._save()
         except Exception as e:
             self.logger.debug(f"Failed to create draft board: {e}")
 
@@ -1,14 +1,79 @@
 import os
 import xmltodict
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from requests_oauthlib import OAuth2Session
 from dotenv import load_dotenv
 import json
+import time
 import logging
+import threading
 import webbrowser
+from datetime import date
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
 from typing import Union, List, Dict, Any
 
 load_dotenv()
 
+API_BASE = "https://fantasysports.yahooapis.com/fantasy/v2"
+
+# Seconds to wait for a Yahoo response before giving up (connect, read)
+REQUEST_TIMEOUT = (5, 20)
+
+# Refresh the access token this many seconds before Yahoo expires it
+TOKEN_REFRESH_MARGIN = 60
+
+# Draft analysis pages fetched concurrently (matches the session's connection pool)
+DRAFT_ANALYSIS_WORKERS = 4
+
+# Upper bound on cached player names (a full draft pool is ~1000 players)
+PLAYER_NAME_CACHE_SIZE = 4096
+
+# Player names saved between runs (player keys only change with the season's game key)
+PLAYER_NAME_FILE = 'player_names.json'
+
+
+def _write_json(path: str, data):
+    """Write ``data`` as JSON to ``path`` atomically.
+
+    The JSON goes to a temporary file in the same directory that then replaces ``path``, so
+    an interrupted write (Ctrl+C mid-refresh) can't leave a truncated token.json behind.
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.remove(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def _cached_response(method):
+    """Memoize a no-argument getter on the instance for the life of the process.
+
+    Only for data that doesn't change during a run (settings, teams, draft analysis); live
+    data such as draft results must not use it. Empty results are not cached so a failed
+    request is retried on the next call.
+    """
+    @wraps(method)
+    def wrapper(self):
+        cache = self._response_cache
+        name = method.__name__
+        if name in cache:
+            return cache[name]
+        result = method(self)
+        if result:
+            cache[name] = result
+        return result
+    return wrapper
+
+
 class YahooFantasyAPI:
     def __init__(self):
         # Credentials / league identifiers
@@ -24,38 +89,87 @@ class YahooFantasyAPI:
         # Session state
         self.session: OAuth2Session | None = None
         self.year_id: str | None = None
+        # Monotonic deadline of the current access token (inf while unknown)
+        self._token_expires_at = float('inf')
+        self._token_lock = threading.Lock()
 
         # Logging
         self.logger = logging.getLogger(__name__)
 
+        # League resource URL prefix, built once the game key is known (see _league_url)
+        self._league_prefix: str | None = None
+
         # Caches
         self._player_name_cache: dict[str, str] = {}
+        self._load_player_cache()
+        self._response_cache: dict[str, Any] = {}
+        # url -> (conditional request headers, parsed body) for conditional requests
+        self._validators: dict[str, tuple] = {}
 
-    def _extract_dict_value(self, data: Union[Dict, Any], key: str = None) -> str:
-        """Extract value from dictionary structure that may have #text key"""
-        if isinstance(data, dict):
-            if key and key in data:
-                return self._extract_dict_value(data[key])
-            return data.get('#text', data)
-        return str(data) if data is not None else ''
-
-    def _ensure_list(self, data: Union[List, Dict, None]) -> List:
+    @staticmethod
+    def _ensure_list(data: Union[List, Dict, None]) -> List:
         """Ensure data is returned as a list"""
-        if data is None:
-            return []
-        if isinstance(data, dict):
-            return [data]
-        return data if isinstance(data, list) else []
+        t = type(data)
+        return data if t is list else [data] if t is dict else []
+
+    @classmethod
+    def _walk(cls, node, *keys, text: bool = False):
+        """Follow ``keys`` through nested xmltodict dicts.
 
-    def _make_api_request(self, url: str) -> Dict[str, Any]:
-        """Make authenticated API request with common error handling"""
+        Returns the node found normalised by ``_ensure_list`` ([] if a step is missing), or
+        with ``text`` its text as a str ('' if missing; '#text' of an attribute node).
+        """
+        for key in keys:
+            if type(node) is not dict:
+                node = None
+                break
+            node = node.get(key)
+        if not text:
+            return cls._ensure_list(node)
+        if type(node) is dict:
+            node = node.get('#text')
+        return '' if node is None else str(node)
+
+    def _make_api_request(self, url: str, item_depth: int = 0, item_callback=None,
+                          conditional: bool = False) -> Dict[str, Any]:
+        """Make authenticated API request with common error handling.
+
+        With ``item_callback`` the body is streamed into xmltodict and every element at
+        ``item_depth`` is passed to the callback as soon as it is parsed (nothing is
+        returned), so a large collection never exists as one document-sized dict.
+
+        With ``conditional`` the ETag / Last-Modified of the previous response for ``url``
+        is sent back; a 304 reuses the earlier parse (no body, no parsing). Callers must
+        treat the returned dict as read-only.
+        """
         if not self.session:
             self.ensure_authenticated()
+        elif time.monotonic() > self._token_expires_at - TOKEN_REFRESH_MARGIN:
+            self._refresh_token()
 
         try:
-            response = self.session.get(url)
+            if item_callback is not None:
+                with self.session.get(url, timeout=REQUEST_TIMEOUT, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True  # undo gzip as expat reads
+                    return xmltodict.parse(response.raw, item_depth=item_depth, item_callback=item_callback)
+            cached = self._validators.get(url) if conditional else None
+            response = self.session.get(url, timeout=REQUEST_TIMEOUT, headers=cached and cached[0])
+            if cached and response.status_code == 304:
+                return cached[1]
             response.raise_for_status()
-            return xmltodict.parse(response.text)
+            # Raw bytes: expat honours the XML encoding declaration itself, so requests never
+            # has to guess a charset (response.text can run charset detection on the whole body)
+            data = xmltodict.parse(response.content)
+            if conditional:
+                validators = {}
+                if response.headers.get('ETag'):
+                    validators['If-None-Match'] = response.headers['ETag']
+                if response.headers.get('Last-Modified'):
+                    validators['If-Modified-Since'] = response.headers['Last-Modified']
+                if validators:
+                    self._validators[url] = (validators, data)
+            return data
         except Exception as e:
             msg = str(e)
             if 'token_expired' in msg.lower():
@@ -64,6 +178,18 @@ class YahooFantasyAPI:
                 self.logger.error(f"API request failed for {url}: {e}")
             raise
 
+    @staticmethod
+    def _pooled(session: OAuth2Session) -> OAuth2Session:
+        """Mount a keep-alive pool sized for the concurrent setup fetches on ``session``.
+
+        Throttling (429) and transient 5xx responses to GETs (idempotent) are retried on the same
+        connection with a short backoff instead of failing the whole poll or page.
+        """
+        retries = Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504))
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4, max_retries=retries)
+        session.mount('https://', adapter)
+        return session
+
     def authenticate(self):
         """Handle OAuth2 authentication flow"""
         yahoo = OAuth2Session(
@@ -94,24 +220,61 @@ class YahooFantasyAPI:
             client_secret=self.client_secret
         )
 
-        self.session = yahoo
+        self.session = self._pooled(yahoo)
 
         # Save token to file for future use
-        with open('token.json', 'w') as f:
-            json.dump(token, f)
+        self._store_token(token)
 
         return True
 
+    def _store_token(self, token: Dict[str, Any], save: bool = True):
+        """Note when ``token`` expires and (optionally) save it to token.json."""
+        # requests-oauthlib stamps tokens with a wall-clock expires_at; keep it as a
+        # monotonic deadline so clock changes during a draft can't skew the refresh
+        expires_at = token.get('expires_at')
+        if expires_at is None:
+            self._token_expires_at = float('inf')
+        else:
+            self._token_expires_at = time.monotonic() + (float(expires_at) - time.time())
+        if save:
+            _write_json('token.json', token)
+
+    def _refresh_token(self, force: bool = False) -> bool:
+        """Refresh the access token ahead of expiry so a poll never waits on a 401 round trip.
+
+        ``force`` refreshes even when the recorded expiry is still ahead (the token was
+        rejected anyway).
+        """
+        with self._token_lock:
+            # Another thread may have refreshed while this one waited
+            if not force and time.monotonic() <= self._token_expires_at - TOKEN_REFRESH_MARGIN:
+                return True
+            try:
+                token = self.session.refresh_token(
+                    self.token_url,
+                    client_id=self.client_id,
+                    client_secret=self.client_secret,
+                    # Held under _token_lock: a hung refresh would stall every worker
+                    timeout=REQUEST_TIMEOUT
+                )
+                self._store_token(token)
+                self.logger.debug("Refreshed access token")
+                return True
+            except Exception as e:
+                self.logger.error(f"Failed to refresh token: {e}")
+                return False
+
     def load_token(self):
         """Load saved token if exists"""
         try:
             with open('token.json', 'r') as f:
                 token = json.load(f)
 
-            self.session = OAuth2Session(
+            self.session = self._pooled(OAuth2Session(
                 self.client_id,
                 token=token
-            )
+            ))
+            self._store_token(token, save=False)
             return True
         except FileNotFoundError:
             return False
@@ -121,301 +284,422 @@ class YahooFantasyAPI:
         if not self.session:
             return False
 
+        # A token whose saved expiry is still comfortably ahead needs no probe request
+        if self._token_expires_at != float('inf') and \
+                time.monotonic() < self._token_expires_at - TOKEN_REFRESH_MARGIN:
+            return True
+
         try:
             # Try a simple API call to check if token is valid
-            self.get_game_key()
+            self._fetch_game_key()
             return True
         except Exception:
             # Token might be expired, try to refresh
-            try:
-                token = self.session.refresh_token(
-                    self.token_url,
-                    client_id=self.client_id,
-                    client_secret=self.client_secret
-                )
-
-                # Save refreshed token
-                with open('token.json', 'w') as f:
-                    json.dump(token, f)
-
-                return True
-            except Exception as e:
-                self.logger.error(f"Failed to refresh token: {e}")
-                return False
+            return self._refresh_token(force=True)
 
     def ensure_authenticated(self):
-        """Ensure we have a valid authenticated session"""
+        """Ensure we have a valid authenticated session and a resolved game key.
+
+        The game key comes from the token probe or game_key.json when either was used, so
+        this rarely costs a request. If it does need a request and that fails, the error is
+        raised here rather than from the first getter; later getters still resolve it lazily
+        through ``_league_url``.
+        """
         if not self.load_token():
             self.authenticate()
         elif not self.refresh_token_if_needed():
             self.authenticate()
+        self.get_game_key()
 
     def get_game_key(self):
-        """Get the current year's game key"""
-        url = "https://fantasysports.yahooapis.com/fantasy/v2/game/nhl"
+        """Get the current year's game key.
+
+        The key only changes between seasons, so it is kept in game_key.json for the rest of
+        the day and later runs skip the request; within a run it is looked up once.
+        """
+        if self.year_id:
+            return self.year_id
+        try:
+            with open('game_key.json', 'r') as f:
+                cached = json.load(f)
+            if cached.get('date') == date.today().isoformat() and cached.get('game_key'):
+                return self._set_game_key(cached['game_key'])
+        except (OSError, ValueError, AttributeError):
+            pass
+        return self._fetch_game_key()
+
+    def _fetch_game_key(self):
+        """Request the game key from Yahoo and remember it in game_key.json."""
+        url = API_BASE + "/game/nhl"
 
-        data = self._make_api_request(url)
+        data = self._make_api_request(url, conditional=True)
         game_data = data['fantasy_content']['game']
-        game_key = self._extract_dict_value(game_data, 'game_key')
+        game_key = self._walk(game_data, 'game_key', text=True)
 
+        try:
+            _write_json('game_key.json', {'date': date.today().isoformat(), 'game_key': game_key})
+        except OSError as e:
+            self.logger.debug(f"Could not cache game key: {e}")
+        return self._set_game_key(game_key)
+
+    def _set_game_key(self, game_key: str) -> str:
         self.year_id = game_key
+        self._league_prefix = f"{API_BASE}/league/{game_key}.l.{self.league_id}"
         self.logger.debug(f"Game key: {game_key}")
         return game_key
 
-    def get_draft_results(self):
-        """Get draft results from Yahoo API"""
-        if not self.year_id:
+    def _league_url(self, suffix: str) -> str:
+        """League resource URL + ``suffix``; the prefix is formatted once per game key."""
+        if not self._league_prefix:
             self.get_game_key()
+        return self._league_prefix + suffix
 
-        url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.year_id}.l.{self.league_id}/draftresults"
-
-        try:
-            data = self._make_api_request(url)
-            league_data = data['fantasy_content']['league']
-
-            self.logger.debug(f"Draft results response structure: {list(league_data.keys())}")
-
-            if 'draft_results' not in league_data:
-                self.logger.debug("No draft_results found in response")
-                return []
-
-            draft_results_data = league_data['draft_results']
+    def get_draft_results(self, since_pick: int = 0):
+        """Get draft results from Yahoo API.
 
-            if draft_results_data is None or 'draft_result' not in draft_results_data:
-                self.logger.debug("No draft_result found in draft_results")
-                return []
+        With ``since_pick`` only picks numbered above it are returned. Yahoo's draftresults
+        resource has no paging, so the response is still fetched whole, but the tail is cut
+        from the end of the pick-ordered list: callers handle O(new picks) entries per poll
+        instead of the whole draft.
+        """
+        url = self._league_url("/draftresults")
 
-            return self._ensure_list(draft_results_data['draft_result'])
+        try:
+            data = self._make_api_request(url, conditional=True)
+            results = self._parse_draft_results(data['fantasy_content']['league'])
+            return self._picks_after(results, since_pick) if since_pick else results
 
         except Exception as e:
             self.logger.error(f"Error getting draft results: {e}")
             return []
 
-    def get_league_settings(self):
-        """Get league settings from Yahoo API"""
-        if not self.year_id:
-            self.get_game_key()
+    @staticmethod
+    def _picks_after(results, since_pick: int):
+        """Tail of pick-ordered ``results`` whose pick number is above ``since_pick``."""
+        i = len(results)
+        while i:
+            try:
+                if int(results[i - 1].get('pick')) <= since_pick:
+                    break
+            except (TypeError, ValueError, AttributeError):
+                pass  # unparsable entry: keep it and let the caller decide
+            i -= 1
+        return results[i:]
+
+    def _parse_draft_results(self, league_data):
+        """Extract the draft_result list from a league node"""
+        # Runs every poll: only build the key list when debug logging is on
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Draft results response structure: {list(league_data.keys())}")
 
-        url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.year_id}.l.{self.league_id}/settings"
+        if 'draft_results' not in league_data:
+            self.logger.debug("No draft_results found in response")
+            return []
 
-        try:
-            data = self._make_api_request(url)
-            league_data = data['fantasy_content']['league']
+        draft_results_data = league_data['draft_results']
 
-            if 'settings' not in league_data:
-                self.logger.debug("No settings found in response")
-                return {}
+        if draft_results_data is None or 'draft_result' not in draft_results_data:
+            self.logger.debug("No draft_result found in draft_results")
+            return []
 
-            settings = league_data['settings']
-            self.logger.debug(f"Raw settings structure keys: {list(settings.keys())}")
+        return self._ensure_list(draft_results_data['draft_result'])
 
-            # Extract key league settings with safe extraction
-            league_settings = {
-                'league_name': self._extract_dict_value(league_data, 'name'),
-                'league_type': self._extract_dict_value(settings, 'draft_type'),
-                'scoring_type': self._extract_dict_value(settings, 'scoring_type'),
-                'max_teams': self._extract_dict_value(settings, 'max_teams'),
-                'num_playoff_teams': self._extract_dict_value(settings, 'num_playoff_teams'),
-                'playoff_start_week': self._extract_dict_value(settings, 'playoff_start_week'),
-                'waiver_type': self._extract_dict_value(settings, 'waiver_type'),
-                'trade_end_date': self._extract_dict_value(settings, 'trade_end_date'),
-                'roster_positions': [],
-                'stat_categories': []
-            }
+    def get_bundle(self, resources=('league_settings', 'teams', 'draft_results')):
+        """Fetch several league sub-resources with ONE request (``;out=settings,teams,...``).
 
-            # Extract roster positions safely
-            try:
-                if 'roster_positions' in settings:
-                    roster_data = settings['roster_positions']
-                    if isinstance(roster_data, dict) and 'roster_position' in roster_data:
-                        positions = roster_data['roster_position']
-                        if isinstance(positions, list):
-                            for pos in positions:
-                                if isinstance(pos, dict):
-                                    league_settings['roster_positions'].append({
-                                        'position': pos.get('position', ''),
-                                        'count': pos.get('count', '')
-                                    })
-                        elif isinstance(positions, dict):
-                            league_settings['roster_positions'].append({
-                                'position': positions.get('position', ''),
-                                'count': positions.get('count', '')
-                            })
-            except Exception as e:
-                self.logger.warning(f"Error extracting roster positions: {e}")
+        Returns a dict keyed by the requested names ('league_settings', 'teams',
+        'draft_results'), shaped like the matching ``get_*`` methods. Falls back to the
+        individual getters if the combined request fails.
+        """
+        parsers = {
+            'league_settings': ('settings', self._parse_league_settings, {}),
+            'teams': ('teams', self._parse_teams, []),
+            'draft_results': ('draftresults', self._parse_draft_results, []),
+        }
+        wanted = [r for r in resources if r in parsers]
+        if not wanted:
+            return {}
+        out = ','.join(parsers[r][0] for r in wanted)
+        url = self._league_url(";out=" + out)
+
+        try:
+            league_data = self._make_api_request(url, conditional=True)['fantasy_content']['league']
+        except Exception as e:
+            self.logger.warning(f"Combined league request failed, fetching individually: {e}")
+            getters = {
+                'league_settings': self.get_league_settings,
+                'teams': self.get_teams_data,
+                'draft_results': self.get_draft_results,
+            }
+            return {r: getters[r]() for r in wanted}
 
-            # Extract stat categories safely
+        bundle = {}
+        for r in wanted:
+            _, parse, empty = parsers[r]
             try:
-                if 'stat_categories' in settings:
-                    stat_data = settings['stat_categories']
-                    if isinstance(stat_data, dict) and 'stats' in stat_data:
-                        stats_section = stat_data['stats']
-                        if isinstance(stats_section, dict) and 'stat' in stats_section:
-                            stats = stats_section['stat']
-                            if isinstance(stats, list):
-                                for stat in stats:
-                                    if isinstance(stat, dict):
-                                        league_settings['stat_categories'].append({
-                                            'stat_id': stat.get('stat_id', ''),
-                                            'name': stat.get('name', ''),
-                                            'display_name': stat.get('display_name', ''),
-                                            'position_type': stat.get('position_type', ''),
-                                            'value': self._get_stat_modifier_value(settings, stat.get('stat_id', ''))
-                                        })
-                            elif isinstance(stats, dict):
-                                league_settings['stat_categories'].append({
-                                    'stat_id': stats.get('stat_id', ''),
-                                    'name': stats.get('name', ''),
-                                    'display_name': stats.get('display_name', ''),
-                                    'position_type': stats.get('position_type', ''),
-                                    'value': self._get_stat_modifier_value(settings, stats.get('stat_id', ''))
-                                })
+                bundle[r] = parse(league_data)
             except Exception as e:
-                self.logger.warning(f"Error extracting stat categories: {e}")
+                self.logger.error(f"Error parsing {r} from combined request: {e}")
+                bundle[r] = empty
+        # Seed the memoized getters so later callers don't refetch static data
+        for r, getter in (('league_settings', 'get_league_settings'), ('teams', 'get_teams_data')):
+            if bundle.get(r):
+                self._response_cache[getter] = bundle[r]
+        return bundle
+
+    @_cached_response
+    def get_league_settings(self):
+        """Get league settings from Yahoo API"""
+        url = self._league_url("/settings")
 
-            self.logger.debug(f"Retrieved league settings for: {league_settings['league_name']}")
-            return league_settings
+        try:
+            data = self._make_api_request(url, conditional=True)
+            return self._parse_league_settings(data['fantasy_content']['league'])
 
         except Exception as e:
             self.logger.error(f"Error getting league settings: {e}")
             return {}
 
-    def _get_stat_modifier_value(self, settings, stat_id):
-        """Get stat modifier value for a given stat ID"""
-        try:
-            if 'stat_modifiers' in settings:
-                modifiers = settings['stat_modifiers']
-                if isinstance(modifiers, dict) and 'stats' in modifiers:
-                    stats_section = modifiers['stats']
-                    if isinstance(stats_section, dict) and 'stat' in stats_section:
-                        stats = stats_section['stat']
-                        if isinstance(stats, list):
-                            for stat in stats:
-                                if isinstance(stat, dict) and stat.get('stat_id') == stat_id:
-                                    return stat.get('value', '')
-                        elif isinstance(stats, dict) and stats.get('stat_id') == stat_id:
-                            return stats.get('value', '')
-        except Exception:
-            pass
-        return ''
+    def _parse_league_settings(self, league_data):
+        """Build the league settings dict from a league node carrying ``settings``"""
+        if 'settings' not in league_data:
+            self.logger.debug("No settings found in response")
+            return {}
 
-    def get_teams_data(self):
-        """Get teams data from Yahoo API"""
-        if not self.year_id:
-            self.get_game_key()
+        settings = league_data['settings']
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Raw settings structure keys: {list(settings.keys())}")
 
-        url = f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.year_id}.l.{self.league_id}/teams"
+        # Extract key league settings with safe extraction
+        league_settings = {
+            'league_name': self._walk(league_data, 'name', text=True),
+            'league_type': self._walk(settings, 'draft_type', text=True),
+            'scoring_type': self._walk(settings, 'scoring_type', text=True),
+            'max_teams': self._walk(settings, 'max_teams', text=True),
+            'num_playoff_teams': self._walk(settings, 'num_playoff_teams', text=True),
+            'playoff_start_week': self._walk(settings, 'playoff_start_week', text=True),
+            'waiver_type': self._walk(settings, 'waiver_type', text=True),
+            'trade_end_date': self._walk(settings, 'trade_end_date', text=True),
+            'roster_positions': [],
+            'stat_categories': []
+        }
+
+        # Extract roster positions safely
+        try:
+            for pos in self._walk(settings, 'roster_positions', 'roster_position'):
+                if type(pos) is dict:
+                    league_settings['roster_positions'].append({
+                        'position': pos.get('position', ''),
+                        'count': pos.get('count', '')
+                    })
+        except Exception as e:
+            self.logger.warning(f"Error extracting roster positions: {e}")
 
+        # Extract stat categories safely
         try:
-            data = self._make_api_request(url)
-            teams = self._ensure_list(data['fantasy_content']['league']['teams']['team'])
+            # Modifier values indexed once instead of a scan of stat_modifiers per category
+            modifiers = self._stat_modifier_index(settings)
+            for stat in self._walk(settings, 'stat_categories', 'stats', 'stat'):
+                if type(stat) is dict:
+                    league_settings['stat_categories'].append({
+                        'stat_id': stat.get('stat_id', ''),
+                        'name': stat.get('name', ''),
+                        'display_name': stat.get('display_name', ''),
+                        'position_type': stat.get('position_type', ''),
+                        'value': modifiers.get(stat.get('stat_id', ''), '')
+                    })
+        except Exception as e:
+            self.logger.warning(f"Error extracting stat categories: {e}")
 
-            teams_data = []
-            for team in teams:
-                team_key = self._extract_dict_value(team, 'team_key')
-                team_id = self._extract_dict_value(team, 'team_id')
-                team_name = self._extract_dict_value(team, 'name')
-                manager_name = self._extract_dict_value(team['managers']['manager'], 'nickname')
+        self.logger.debug(f"Retrieved league settings for: {league_settings['league_name']}")
+        return league_settings
 
-                teams_data.append([team_key, team_id, team_name, manager_name])
+    def _stat_modifier_index(self, settings):
+        """Map stat_id -> modifier value from ``settings`` (first entry per id wins)."""
+        index = {}
+        for stat in self._walk(settings, 'stat_modifiers', 'stats', 'stat'):
+            if type(stat) is dict:
+                index.setdefault(stat.get('stat_id'), stat.get('value', ''))
+        return index
 
-            return teams_data
+    @_cached_response
+    def get_teams_data(self):
+        """Get teams data from Yahoo API"""
+        url = self._league_url("/teams")
+
+        try:
+            data = self._make_api_request(url, conditional=True)
+            return self._parse_teams(data['fantasy_content']['league'])
 
         except Exception as e:
             self.logger.error(f"Error getting teams data: {e}")
             return []
 
+    def _parse_teams(self, league_data):
+        """Build ``[team_key, team_id, team_name, manager]`` rows from a league node"""
+        teams = self._ensure_list(league_data['teams']['team'])
+
+        teams_data = []
+        for team in teams:
+            team_key = self._walk(team, 'team_key', text=True)
+            team_id = self._walk(team, 'team_id', text=True)
+            team_name = self._walk(team, 'name', text=True)
+            manager_name = self._walk(team, 'managers', 'manager', 'nickname', text=True)
+
+            teams_data.append([team_key, team_id, team_name, manager_name])
+
+        return teams_data
 
+
+    @_cached_response
     def get_player_draft_analysis(self):
         """Get draft analysis data including ADP if available - fetch in batches"""
-        if not self.year_id:
-            self.get_game_key()
+        rows = list(self.iter_player_draft_analysis())
+        if rows:
+            self.save_player_cache()
+        return rows
+
+    def iter_player_draft_analysis(self):
+        """Yield draft analysis rows page by page as Yahoo returns them (25 players per page).
 
+        Up to DRAFT_ANALYSIS_WORKERS pages are in flight at once on a small thread pool (the
+        requests are I/O bound and share the session's keep-alive pool); a new page is
+        requested as each one is consumed, and rows are still yielded in page order.
+        """
         # Base endpoints based on the correct Yahoo API structure
         base_endpoints = [
-            f"https://fantasysports.yahooapis.com/fantasy/v2/league/{self.year_id}.l.{self.league_id}/players;position=ALL;sort=average_pick;out=auction_values,ranks;ranks=season;ranks_by_position=season/draft_analysis;cut_types=diamond;slices=last7days"
+            self._league_url("/players;position=ALL;sort=average_pick;out=auction_values,ranks;ranks=season;ranks_by_position=season/draft_analysis;cut_types=diamond;slices=last7days")
         ]
 
+        batch_size = 25  # Yahoo API seems to limit to 25
+        max_iterations = 15  # 15 * 25 = 375 players max
+        workers = DRAFT_ANALYSIS_WORKERS
+
         for base_url in base_endpoints:
             try:
                 self.logger.debug(f"Trying draft analysis with batching from: {base_url}")
 
-                all_draft_data = []
-                start = 0
-                batch_size = 25  # Yahoo API seems to limit to 25
-                max_iterations = 15  # 40 * 25 = 1000 players max
-
-                for iteration in range(max_iterations):
-                    # Insert the start and count parameters into the URL
-                    url = base_url.replace(";position=ALL;", f";position=ALL;start={start};count={batch_size};")
-
+                total = 0
+                # Split once; each page URL is then one f-string with start/count in between
+                head, _, tail = base_url.partition(";position=ALL;")
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    def submit(iteration):
+                        # Insert the start and count parameters into the URL
+                        start = iteration * batch_size
+                        url = f"{head};position=ALL;start={start};count={batch_size};{tail}"
+                        return start, pool.submit(self._draft_analysis_page, url)
+
+                    # Sliding window: keep ``workers`` pages in flight, topping up as each is consumed
+                    pending = deque(submit(i) for i in range(min(workers, max_iterations)))
+                    next_iteration = len(pending)
+                    iteration = 0
                     try:
-                        data = self._make_api_request(url)
-
-                        # Navigate the response structure
-                        if 'fantasy_content' in data:
-                            content = data['fantasy_content']
-                            players_data = None
-
-                            if 'league' in content and 'players' in content['league']:
-                                players_data = content['league']['players']
-                            elif 'game' in content and 'players' in content['game']:
-                                players_data = content['game']['players']
-
-                            if players_data and 'player' in players_data:
-                                players = self._ensure_list(players_data['player'])
-
-                                if not players:
-                                    self.logger.debug(f"No more players found at start={start}. Stopping.")
-                                    break
-
-                                batch_draft_data = []
-                                for player in players:
-                                    player_info = self._extract_draft_analysis_data(player)
-                                    if player_info:
-                                        batch_draft_data.append(player_info)
-
-                                all_draft_data.extend(batch_draft_data)
-                                self.logger.debug(f"Batch {iteration + 1}: Got {len(batch_draft_data)} players, total: {len(all_draft_data)}")
-
-                                # If we got fewer players than requested, we've reached the end
-                                if len(players) < batch_size:
-                                    self.logger.debug(f"Reached end of data. Got {len(players)} in final batch.")
-                                    break
-                            else:
-                                self.logger.debug(f"No players data found at start={start}")
+                        while pending:
+                            start, future = pending.popleft()
+                            if next_iteration < max_iterations:
+                                pending.append(submit(next_iteration))
+                                next_iteration += 1
+                            players = future.result()
+                            iteration += 1
+
+                            if not players:
+                                self.logger.debug("No more players found at start=%d. Stopping.", start)
                                 break
 
-                    except Exception as e:
-                        self.logger.warning(f"Error in batch {iteration + 1} at start={start}: {e}")
-                        break
+                            batch_draft_data = self._extract_many(players)
+                            for player_info in batch_draft_data:
+                                if player_info[0] and player_info[1]:
+                                    # Names come for free here; spare get_player_name a request
+                                    self._remember_player_name(player_info[0], player_info[1])
 
-                    start += batch_size
+                            total += len(batch_draft_data)
+                            # Lazy %-formatting: the per-page messages cost nothing unless debug is on
+                            self.logger.debug("Batch %d: Got %d players, total: %d", iteration, len(batch_draft_data), total)
+                            yield from batch_draft_data
+
+                            # If we got fewer players than requested, we've reached the end
+                            if len(players) < batch_size:
+                                self.logger.debug("Reached end of data. Got %d in final batch.", len(players))
+                                break
+                    finally:
+                        # Pages past the end (or after the caller stops) that haven't started are never sent
+                        for _, future in pending:
+                            future.cancel()
 
-                if all_draft_data:
-                    self.logger.debug(f"Successfully extracted draft data for {len(all_draft_data)} players from {base_url}")
-                    return all_draft_data
+                if total:
+                    self.logger.debug(f"Successfully extracted draft data for {total} players from {base_url}")
+                    return
 
             except Exception as e:
                 self.logger.debug(f"Failed to get batched data from {base_url}: {e}")
                 continue
 
         self.logger.debug("No draft analysis data available from any endpoint")
-        return []
+
+    def _draft_analysis_page(self, url: str) -> List:
+        """Fetch one page of the draft analysis; [] on error or when Yahoo has no more players."""
+        players = []
+
+        def collect(path, item):
+            # fantasy_content > league (or game) > players > player
+            if path[-1][0] == 'player':
+                players.append(item)
+            return True
+
+        try:
+            # Streamed: players are collected as they parse, without the surrounding document
+            self._make_api_request(url, item_depth=4, item_callback=collect)
+        except Exception as e:
+            self.logger.warning(f"Error fetching draft analysis page {url}: {e}")
+            return []
+        return players
 
     # -------------------- Lightweight Player Lookup --------------------
+    def _remember_player_name(self, player_key: str, full_name: str):
+        """Cache a player name, evicting the oldest entry once PLAYER_NAME_CACHE_SIZE is reached."""
+        cache = self._player_name_cache
+        if player_key not in cache and len(cache) >= PLAYER_NAME_CACHE_SIZE:
+            del cache[next(iter(cache))]
+        cache[player_key] = full_name
+
+    def clear_player_cache(self):
+        """Forget all cached player names, including the saved copy."""
+        self._player_name_cache.clear()
+        try:
+            os.remove(PLAYER_NAME_FILE)
+        except OSError:
+            pass
+
+    def _load_player_cache(self):
+        """Seed the name cache from player_names.json so reruns skip those lookups."""
+        try:
+            with open(PLAYER_NAME_FILE, 'r') as f:
+                names = json.load(f)
+        except (OSError, ValueError):
+            return
+        if type(names) is dict:
+            for key, name in list(names.items())[-PLAYER_NAME_CACHE_SIZE:]:
+                self._player_name_cache[key] = name
+
+    def save_player_cache(self):
+        """Write the name cache to player_names.json (player keys are fixed for the season)."""
+        try:
+            _write_json(PLAYER_NAME_FILE, self._player_name_cache)
+        except OSError as e:
+            self.logger.debug(f"Could not save player names: {e}")
+
     def get_player_name(self, player_key: str) -> str:
         """Fetch a single player's full name by player_key with simple caching.
 
-        Uses the player endpoint: /fantasy/v2/player/{player_key}
+        Uses the player endpoint: /fantasy/v2/player/{player_key}. Names seen in the draft
+        analysis are cached as they stream in, so most lookups never hit the network.
         """
         if not player_key:
             return ""
-        if player_key in self._player_name_cache:
-            return self._player_name_cache[player_key]
-        if not self.year_id:
-            self.get_game_key()
-        url = f"https://fantasysports.yahooapis.com/fantasy/v2/player/{player_key}"
+        cached = self._player_name_cache.get(player_key)
+        if cached is not None:
+            return cached
+        url = f"{API_BASE}/player/{player_key}"
         try:
             data = self._make_api_request(url)
             # Navigate to player -> name -> full
@@ -430,32 +714,80 @@ class YahooFantasyAPI:
                 if isinstance(name_dict, dict):
                     full_name = name_dict.get('full') or name_dict.get('first') or ""
             full_name = full_name or "(unknown)"
-            self._player_name_cache[player_key] = full_name
+            self._remember_player_name(player_key, full_name)
             return full_name
         except Exception as e:
             self.logger.warning(f"Failed to fetch player name for {player_key}: {e}")
             return ""
 
-    def _extract_draft_analysis_data(self, player):
-        """Extract draft-related information from a player object"""
-        try:
-            player_key = self._extract_dict_value(player, 'player_key')
-            full_name = self._extract_dict_value(player['name'], 'full')
-
-            draft_info = {}
-            if 'draft_analysis' in player:
-                draft_analysis = player['draft_analysis']
-                draft_info['average_pick'] = self._extract_dict_value(draft_analysis, 'average_pick')
-                draft_info['average_round'] = self._extract_dict_value(draft_analysis, 'average_round')
-
-            return [
-                player_key,
-                full_name,
-                self._extract_dict_value(player, 'editorial_team_abbr'),
-                self._extract_dict_value(player, 'display_position'),
-                draft_info.get('average_pick', ''),
-            ]
+    def get_player_names(self, player_keys, batch_size: int = 25) -> Dict[str, str]:
+        """Look up several player names with one request per ``batch_size`` uncached keys.
 
+        Uses the collection endpoint /fantasy/v2/players;player_keys=k1,k2,... instead of one
+        round-trip per player, with the chunks fetched concurrently. Results land in the same
+        cache as ``get_player_name`` (and in player_names.json); keys Yahoo doesn't return
+        map to "".
+        """
+        keys = list(dict.fromkeys(k for k in player_keys if k))
+        missing = [k for k in keys if k not in self._player_name_cache]
+        if missing:
+            urls = [API_BASE + "/players;player_keys=" + ",".join(missing[i:i + batch_size])
+                    for i in range(0, len(missing), batch_size)]
+            if len(urls) == 1:
+                pages = [self._player_names_page(urls[0])]
+            else:
+                with ThreadPoolExecutor(max_workers=min(len(urls), DRAFT_ANALYSIS_WORKERS)) as pool:
+                    pages = list(pool.map(self._player_names_page, urls))
+            for page in pages:
+                for key, name in page:
+                    self._remember_player_name(key, name)
+            self.save_player_cache()
+        return {k: self._player_name_cache.get(k, "") for k in keys}
+
+    def _player_names_page(self, url: str) -> List[tuple]:
+        """(player_key, name) pairs from one players;player_keys= request; [] on error."""
+        try:
+            data = self._make_api_request(url)
         except Exception as e:
-            self.logger.error(f"Error extracting draft info for player: {e}")
+            self.logger.warning(f"Failed to fetch player names from {url}: {e}")
+            return []
+        players = (data.get('fantasy_content', {}).get('players') or {}).get('player')
+        walk = self._walk
+        return [(key, walk(player, 'name', 'full', text=True) or "(unknown)")
+                for player in self._ensure_list(players)
+                if (key := walk(player, 'player_key', text=True))]
+
+    # Paths for the draft analysis row: playerKey, playerName, team, position, averagePick
+    _DRAFT_ANALYSIS_FIELDS = (
+        ('player_key',),
+        ('name', 'full'),
+        ('editorial_team_abbr',),
+        ('display_position',),
+        ('draft_analysis', 'average_pick'),
+    )
+
+    def _extract_draft_analysis_data(self, player):
+        """Extract draft-related information from a player object; None if it has no name"""
+        if type(player) is not dict or 'name' not in player:
+            self.logger.error("Error extracting draft info for player: no name")
             return None
+        walk = self._walk
+        return [walk(player, *path, text=True) for path in self._DRAFT_ANALYSIS_FIELDS]
+
+    def _extract_many(self, players) -> List[List[str]]:
+        """Draft analysis rows for a page of players, skipping entries that can't be read.
+
+        Well-formed players are handled in one tight loop; anything else goes through
+        ``_extract_draft_analysis_data`` so it is logged the same way.
+        """
+        walk = self._walk
+        fields = self._DRAFT_ANALYSIS_FIELDS
+        rows = []
+        for player in players:
+            if type(player) is dict and 'name' in player:
+                rows.append([walk(player, *path, text=True) for path in fields])
+            else:
+                row = self._extract_draft_analysis_data(player)
+                if row:
+                    rows.append(row)
+        return rows